@@ -22,10 +22,13 @@ from ._wrapper import (
     ApplicationWrapper,
     create_wrapper
 )
+from ._executor import clear_executable_cache
+from ._environment import clear_env_file_cache
 from ._commands import (
     CommandDefinition,
     CommandRegistry,
-    find_commands_file
+    find_commands_file,
+    clear_commands_file_cache
 )
 from ._discovery import (
     BundleInfo,
@@ -50,11 +53,14 @@ __all__ = [
     
     # Utility functions
     'create_wrapper',
+    'clear_executable_cache',
+    'clear_env_file_cache',
     
     # CLI components
     'CommandDefinition',
     'CommandRegistry',
     'find_commands_file',
+    'clear_commands_file_cache',
     'cli_main',
     
     # Bundle discovery
@@ -12,4 +12,4 @@ from ._cli import main
 
 
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(main(exec_=True))
@@ -1,12 +1,13 @@
 """Command-line interface for envoy."""
 
 import os
+import re
 import sys
-import argparse
 import logging
 from pathlib import Path
+from types import SimpleNamespace
 
-from ._commands import CommandRegistry, find_commands_file
+from ._commands import CommandDefinition, CommandRegistry, find_commands_file
 from ._discovery import get_bundles, BundleInfo
 from ._wrapper import ApplicationWrapper
 from ._environment import EnvironmentManager
@@ -17,6 +18,9 @@ from ._exceptions import WrapperError
 
 log = logging.getLogger(__name__)
 
+# ENVOY_ALLOWLIST entries may be separated by semicolons or commas
+_ALLOWLIST_SEP = re.compile(r'[;,]')
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration.
@@ -32,6 +36,35 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def _bundle_env_files(cmd: CommandDefinition, bundles: list[BundleInfo]) -> list[Path]:
+    """Collect a command's environment files from the discovered bundles.
+    
+    global_env.json from every bundle comes first, then each of the
+    command's env files from every bundle providing it, in bundle order.
+    Uses the bundles' env_files indexes, so no per-file filesystem calls
+    are made.
+    Bundle roots are resolved at discovery, so a file reached through
+    overlapping roots or a repeated config entry compares equal and is
+    only loaded once.
+    
+    Args:
+        cmd: Command definition
+        bundles: Discovered bundles
+        
+    Returns:
+        Environment file paths in load order
+        
+    """
+    env_files: dict[Path, None] = {}  # Ordered set
+    for name in ('global_env.json', *cmd.environment):
+        for bundle in bundles:
+            path = bundle.env_files.get(name)
+            if path is not None and path not in env_files:
+                env_files[path] = None
+                log.debug("Found environment file: %s", path)
+    return list(env_files)
+
+
 def list_commands(registry: CommandRegistry) -> int:
     """List all available commands.
     
@@ -42,26 +75,26 @@ def list_commands(registry: CommandRegistry) -> int:
         Exit code (0 for success)
         
     """
-    commands = registry.list_commands()
+    commands = registry.items()
     
     if not commands:
         print("No commands defined.")
         return 1
     
-    print("Available commands:")
-    print()
-    
-    for cmd_name in commands:
-        cmd = registry.get(cmd_name)
-        if cmd:
-            # Build command display
-            bundle_str = f" [{cmd.bundle}]" if cmd.bundle else ""
-            
-            if cmd.alias:
-                alias_str = " ".join(cmd.alias)
-                print(f"  {cmd_name:<20} → {alias_str}{bundle_str}")
-            else:
-                print(f"  {cmd_name:<20} (executable on PATH){bundle_str}")
+    lines = ["Available commands:", ""]
+    
+    for cmd_name, cmd in commands:
+        # Build command display
+        bundle_str = f" [{cmd.bundle}]" if cmd.bundle else ""
+        
+        if cmd.alias:
+            alias_str = " ".join(cmd.alias)
+            lines.append(f"  {cmd_name:<20} → {alias_str}{bundle_str}")
+        else:
+            lines.append(f"  {cmd_name:<20} (executable on PATH){bundle_str}")
+    
+    # One write for the whole listing rather than a print per command
+    print("\n".join(lines))
     
     return 0
 
@@ -83,25 +116,26 @@ def show_command_info(registry: CommandRegistry, command_name: str) -> int:
         print(f"Error: Command '{command_name}' not found")
         return 1
     
-    print(f"Command: {command_name}")
+    lines = [f"Command: {command_name}"]
     
     if cmd.bundle:
-        print(f"Bundle: {cmd.bundle}")
+        lines.append(f"Bundle: {cmd.bundle}")
     
-    print(f"Executable: {cmd.executable}")
+    lines.append(f"Executable: {cmd.executable}")
     
     if cmd.base_args:
-        print(f"Base args: {' '.join(cmd.base_args)}")
+        lines.append(f"Base args: {' '.join(cmd.base_args)}")
     
-    print(f"Environment files:")
-    for env_file in cmd.environment:
-        print(f"  - {env_file}")
+    lines.append("Environment files:")
+    lines.extend(f"  - {env_file}" for env_file in cmd.environment)
     
     if cmd.envoy_env_dir:
-        print(f"Environment directory: {cmd.envoy_env_dir}")
+        lines.append(f"Environment directory: {cmd.envoy_env_dir}")
     
     if cmd.alias:
-        print(f"Alias: {' '.join(cmd.alias)}")
+        lines.append(f"Alias: {' '.join(cmd.alias)}")
+    
+    print("\n".join(lines))
     
     return 0
 
@@ -111,7 +145,7 @@ def show_which(
     command_name: str,
     bundles: list[BundleInfo] | None = None,
     inherit_env: bool = False,
-    env_allowlist: set[str] | None = None,
+    env_allowlist: frozenset[str] | None = None,
 ) -> int:
     """Show the resolved executable path for a command.
     
@@ -143,24 +177,18 @@ def show_which(
         return 0
     
     # Build env files the same way run_command does so PATH is correct.
-    env_files = []
+    env_files: list[Path] = []
     if bundles:
-        for bundle in bundles:
-            if 'global_env.json' in bundle.env_files:
-                env_files.append(str(bundle.env_files['global_env.json']))
-        for env_file_name in cmd.environment:
-            for bundle in bundles:
-                if env_file_name in bundle.env_files:
-                    env_files.append(str(bundle.env_files[env_file_name]))
+        env_files = _bundle_env_files(cmd, bundles)
     elif cmd.envoy_env_dir:
         global_env = cmd.envoy_env_dir / 'global_env.json'
         if global_env.exists():
-            env_files.append(str(global_env))
-        env_files.extend(str(cmd.envoy_env_dir / f) for f in cmd.environment)
+            env_files.append(global_env)
+        env_files.extend(cmd.envoy_env_dir / f for f in cmd.environment)
     
     env_mgr = EnvironmentManager(inherit_env=inherit_env, allowlist=env_allowlist)
     try:
-        env = env_mgr.prepare_environment(env_files=[Path(f) for f in env_files])
+        env = env_mgr.prepare_environment(env_files=env_files)
     except WrapperError as e:
         print(f"Warning: Could not build environment: {e}", file=sys.stderr)
         env = {}
@@ -182,7 +210,8 @@ def run_command(
     bundles: list[BundleInfo] | None = None,
     verbose: bool = False,
     inherit_env: bool = False,
-    env_allowlist: set[str] | None = None
+    env_allowlist: frozenset[str] | None = None,
+    exec_: bool = False
 ) -> int:
     """Run a command from the registry.
     
@@ -194,9 +223,14 @@ def run_command(
         verbose: Enable verbose output
         inherit_env: If True, child process inherits the full system environment
         env_allowlist: System variable names to inherit in closed mode
+        exec_: On POSIX without verbose, replace the current process with the
+            command instead of running it as a child. Only for entry points
+            that have nothing left to do afterwards - this call then does not
+            return once the command has started.
         
     Returns:
-        Exit code from the executed command
+        Exit code from the executed command, or from the failed attempt to
+        start it
         
     """
     cmd = registry.get(command_name)
@@ -207,20 +241,11 @@ def run_command(
         return 1
     
     # Collect environment files
-    env_files = []
+    env_files: list[Path] = []
     
     if bundles:
         # Multi-bundle mode: use pre-indexed env_files dict — no filesystem calls at run time
-        for bundle in bundles:
-            if 'global_env.json' in bundle.env_files:
-                env_files.append(str(bundle.env_files['global_env.json']))
-                log.debug(f"Found global environment file: {bundle.env_files['global_env.json']}")
-        
-        for env_file_name in cmd.environment:
-            for bundle in bundles:
-                if env_file_name in bundle.env_files:
-                    env_files.append(str(bundle.env_files[env_file_name]))
-                    log.debug(f"Found environment file: {bundle.env_files[env_file_name]}")
+        env_files = _bundle_env_files(cmd, bundles)
     else:
         # Legacy mode: use command's envoy_env_dir
         if cmd.envoy_env_dir:
@@ -237,28 +262,26 @@ def run_command(
         # Collect global_env.json first if it exists
         global_env = wrapper_env_dir / 'global_env.json'
         if global_env.exists():
-            env_files.append(str(global_env))
-            log.debug(f"Found global environment file: {global_env}")
+            env_files.append(global_env)
+            log.debug("Found global environment file: %s", global_env)
         
-        # Build full environment file paths
-        cmd_env_files = [str(wrapper_env_dir / env_file) for env_file in cmd.environment]
-        
-        # Verify all environment files exist (only in legacy mode)
-        for env_file in cmd_env_files:
-            if not Path(env_file).exists():
-                print(f"Error: Environment file not found: {env_file}", file=sys.stderr)
-                return 1
-        
-        env_files.extend(cmd_env_files)
+        # Build full environment file paths. Missing files are reported by
+        # the environment loader when it opens them.
+        env_files.extend(wrapper_env_dir / env_file for env_file in cmd.environment)
     
     # Combine base args with user args
     full_args = cmd.base_args + args
     
+    if exec_ and os.name != 'nt' and not verbose:
+        # Nothing is reported about the run itself, so replace this process
+        # with the command instead of keeping a parent around to wait on it.
+        return _exec_command(cmd.executable, full_args, env_files, inherit_env, env_allowlist)
+    
     # Create wrapper config
     config = WrapperConfig(
         executable=cmd.executable,
         args=full_args,
-        env_files=[Path(f) for f in env_files],
+        env_files=env_files,
         inherit_env=inherit_env,
         env_allowlist=env_allowlist,
         capture_output=False,
@@ -279,16 +302,63 @@ def run_command(
         return 130
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Main CLI entry point.
+def _exec_command(
+    executable: str,
+    args: list[str],
+    env_files: list[Path],
+    inherit_env: bool,
+    env_allowlist: frozenset[str] | None,
+) -> int:
+    """Replace the current process with a command (POSIX only).
+    
+    Builds the same environment ApplicationWrapper would and resolves the
+    executable against its PATH, then execs it. The command's exit status
+    and signals then belong to the command directly.
     
     Args:
-        argv: Command-line arguments (defaults to sys.argv[1:])
+        executable: Executable name or path
+        args: Arguments to pass to the command
+        env_files: Environment files to load, in order
+        inherit_env: If True, the command inherits the full system environment
+        env_allowlist: System variable names to inherit in closed mode
         
     Returns:
-        Exit code
+        Exit code (only returned if the command could not be started)
+        
+    """
+    try:
+        env = EnvironmentManager(
+            inherit_env=inherit_env,
+            allowlist=env_allowlist
+        ).prepare_environment(env_files=env_files)
+        resolved = ProcessExecutor.resolve_executable(executable, search_path=env.get('PATH'))
+    except WrapperError as e:
+        print(f"Error: Execution failed: {e}", file=sys.stderr)
+        return 1
+    
+    # Buffered output is lost once the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+    
+    try:
+        os.execve(resolved, [resolved, *args], env)
+    except OSError as e:
+        print(f"Error: Execution failed: {e}", file=sys.stderr)
+        return 1
+
+
+def _build_parser() -> 'argparse.ArgumentParser':
+    """Build the envoy argument parser.
+    
+    argparse is imported here so plain command launches, which never need
+    the parser, don't pay for the import.
+    
+    Returns:
+        Configured ArgumentParser
         
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog='envoy',
         description='Envoy: Environment orchestration for applications'
@@ -348,11 +418,45 @@ def main(argv: list[str] | None = None) -> int:
         help='Arguments to pass to the command'
     )
     
-    # Parse args - use parse_known_args to allow passthrough to commands
+    return parser
+
+
+def main(argv: list[str] | None = None, exec_: bool = False) -> int:
+    """Main CLI entry point.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        exec_: Let a plain command run replace the current process, see
+            run_command. Set by the console entry points only.
+        
+    Returns:
+        Exit code
+        
+    """
     if argv is None:
         argv = sys.argv[1:]
     
-    args, unknown_args = parser.parse_known_args(argv)
+    if argv and argv[0] and not any(arg.startswith('-') for arg in argv):
+        # Plain 'envoy <command> [args...]' - no flags for argparse to handle.
+        # An empty command name still goes through argparse, which is needed
+        # to print help.
+        parser = None
+        args = SimpleNamespace(
+            list=False,
+            info=None,
+            which=None,
+            commands_file=None,
+            bundles_config=None,
+            verbose=False,
+            inherit_env=False,
+            command=argv[0],
+            args=argv[1:],
+        )
+        unknown_args = []
+    else:
+        # Parse args - use parse_known_args to allow passthrough to commands
+        parser = _build_parser()
+        args, unknown_args = parser.parse_known_args(argv)
     
     # Combine args with any unknown args (these should be passed to the command)
     if unknown_args:
@@ -371,7 +475,7 @@ def main(argv: list[str] | None = None) -> int:
         try:
             discovered_bundles = get_bundles(config_file=args.bundles_config)
             if discovered_bundles:
-                log.info(f"Discovered {len(discovered_bundles)} bundle(s) from config file")
+                log.info("Discovered %d bundle(s) from config file", len(discovered_bundles))
                 registry.load_from_bundles(discovered_bundles)
                 bundles = discovered_bundles
             else:
@@ -394,11 +498,11 @@ def main(argv: list[str] | None = None) -> int:
         try:
             discovered_bundles = get_bundles()
             if discovered_bundles:
-                log.info(f"Auto-discovered {len(discovered_bundles)} bundle(s)")
+                log.info("Auto-discovered %d bundle(s)", len(discovered_bundles))
                 registry.load_from_bundles(discovered_bundles)
                 bundles = discovered_bundles
         except WrapperError as e:
-            log.debug(f"Bundle auto-discovery failed: {e}")
+            log.debug("Bundle auto-discovery failed: %s", e)
         
         # Fall back to local commands.json if no bundles found
         if len(registry) == 0:
@@ -428,14 +532,19 @@ def main(argv: list[str] | None = None) -> int:
     if args.info:
         return show_command_info(registry, args.info)
     
+    # Nothing to resolve - skip the environment work entirely
+    if not args.which and not args.command:
+        parser.print_help()
+        return 0
+    
     # Parse allowlist and inherit-env — needed by both --which and run.
     allowlist_str = os.environ.get('ENVOY_ALLOWLIST', '')
     env_allowlist = (
-        {v.strip() for v in allowlist_str.replace(',', ';').split(';') if v.strip()}
+        frozenset(name for name in map(str.strip, _ALLOWLIST_SEP.split(allowlist_str)) if name)
         if allowlist_str else None
     )
-    if env_allowlist:
-        log.debug(f"Allowlist: {sorted(env_allowlist)}")
+    if env_allowlist and log.isEnabledFor(logging.DEBUG):
+        log.debug("Allowlist: %s", sorted(env_allowlist))
 
     # Handle which
     if args.which:
@@ -447,11 +556,6 @@ def main(argv: list[str] | None = None) -> int:
             env_allowlist=env_allowlist,
         )
     
-    # Must have a command to execute
-    if not args.command:
-        parser.print_help()
-        return 0
-    
     # Execute command
     return run_command(
         registry=registry,
@@ -460,9 +564,10 @@ def main(argv: list[str] | None = None) -> int:
         bundles=bundles,
         verbose=args.verbose,
         inherit_env=args.inherit_env,
-        env_allowlist=env_allowlist
+        env_allowlist=env_allowlist,
+        exec_=exec_
     )
 
 
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(main(exec_=True))
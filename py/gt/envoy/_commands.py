@@ -6,9 +6,18 @@ from pathlib import Path
 
 from ._exceptions import WrapperError
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; the stdlib parser is the fallback.
+    orjson = None
+
 
 log = logging.getLogger(__name__)
 
+# find_commands_file results keyed by resolved start directory. Entries are
+# re-checked on hit so a deleted file falls back to a fresh search.
+_COMMANDS_FILE_CACHE: dict[Path, Path] = {}
+
 
 class CommandDefinition:
     """Represents a command definition from commands.json.
@@ -22,6 +31,8 @@ class CommandDefinition:
         
     """
     
+    __slots__ = ('name', 'environment', 'alias', 'bundle', 'envoy_env_dir')
+    
     def __init__(
         self,
         name: str,
@@ -109,8 +120,9 @@ class CommandRegistry:
         wrapper_env_dir = commands_file.parent
         
         try:
-            with open(commands_file, 'r', encoding='utf-8') as f:
-                commands_data = json.load(f)
+            with open(commands_file, 'rb') as f:
+                raw = f.read()
+            commands_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             if not isinstance(commands_data, dict):
                 raise WrapperError(
@@ -200,6 +212,15 @@ class CommandRegistry:
         """
         return sorted(self._commands.keys())
     
+    def items(self) -> list[tuple[str, CommandDefinition]]:
+        """Get all command definitions paired with their names.
+        
+        Returns:
+            List of (name, CommandDefinition) tuples sorted by name
+            
+        """
+        return sorted(self._commands.items())
+    
     def __contains__(self, command_name: str) -> bool:
         """Check if a command exists.
         
@@ -232,12 +253,28 @@ def find_commands_file(start_path: Path | None = None) -> Path | None:
     
     current = start_path.resolve()
     
-    # Search up the tree for envoy_env directory
-    for parent in [current] + list(current.parents):
-        wrapper_env_dir = parent / "envoy_env"
-        if wrapper_env_dir.is_dir():
-            commands_file = wrapper_env_dir / "commands.json"
-            if commands_file.exists():
-                return commands_file
+    cached = _COMMANDS_FILE_CACHE.get(current)
+    if cached and cached.is_file():
+        return cached
+    
+    # Search up the tree for envoy_env directory. A regular file at
+    # envoy_env/commands.json implies the directory, so one stat per level
+    # is enough.
+    for parent in (current, *current.parents):
+        commands_file = parent / "envoy_env" / "commands.json"
+        if commands_file.is_file():
+            _COMMANDS_FILE_CACHE[current] = commands_file
+            return commands_file
     
     return None
+
+
+def clear_commands_file_cache() -> None:
+    """Forget every commands.json location found by find_commands_file.
+    
+    The cache grows with each distinct start directory searched. Long-running
+    hosts can call this to release it, or to pick up an envoy_env/ created
+    closer to a directory that was already searched.
+    
+    """
+    _COMMANDS_FILE_CACHE.clear()
@@ -7,15 +7,48 @@ Supports two methods of discovering bundles:
 """
 
 import os
+import re
+import functools
+import time
 import logging
 from pathlib import Path
+from typing import Callable
 import json
 
 from ._exceptions import WrapperError
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; the stdlib parser is the fallback.
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Format version of the on-disk auto-discovery index. Bump when the entry
+# layout or the walk semantics change so stale indexes are ignored.
+_BUNDLE_INDEX_VERSION = 1
+
+# Directories modified this recently are not recorded in the index: coarse
+# mtime resolution (notably on network filesystems) can hide a change made in
+# the same tick the walk read them.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Directory names never descended into while searching for git repositories.
+# These hold large generated trees (dependencies, caches, virtualenvs) that
+# are never bundles themselves. Extend with ENVOY_DISCOVERY_IGNORE.
+_DEFAULT_IGNORE: frozenset[str] = frozenset({
+    'node_modules',
+    '__pycache__',
+    'venv',
+})
+
+# ENVOY_DISCOVERY_IGNORE entries may be separated by semicolons or colons
+_IGNORE_SEP = re.compile(r'[;:]')
+
+# Default cap on discovery I/O run concurrently (override with ENVOY_DISCOVERY_THREADS).
+_DEFAULT_DISCOVERY_THREADS = 8
+
 
 class BundleInfo:
     """Information about a discovered bundle."""
@@ -31,18 +64,27 @@ class BundleInfo:
         self.root = root
         self.name = name
         self.envoy_env = root / "envoy_env"
-        self.env_files: dict[str, Path] = self._index_env_files()
 
-    def _index_env_files(self) -> dict[str, Path]:
-        """Scan envoy_env/ once and index all JSON files by filename.
+    @functools.cached_property
+    def env_files(self) -> dict[str, Path]:
+        """Index of all JSON files in envoy_env/ by filename.
+        
+        Scanned on first access, so bundles whose env files are never
+        looked up (e.g. for --list) cost no directory listing.
         
         Returns:
             Dict mapping filename to absolute Path
         
         """
-        if not self.envoy_env.is_dir():
+        try:
+            with os.scandir(self.envoy_env) as entries:
+                return {
+                    entry.name: Path(entry.path) for entry in entries
+                    if os.path.normcase(entry.name).endswith('.json') and entry.is_file()
+                }
+        except OSError:
+            # Missing or unreadable envoy_env/
             return {}
-        return {f.name: f for f in self.envoy_env.glob('*.json')}
         
     def __repr__(self):
         return f"BundleInfo(name={self.name}, root={self.root})"
@@ -100,75 +142,357 @@ def validate_bundle(path: Path) -> bool:
     return True
 
 
-def find_git_repos(root_dir: Path, max_depth: int = 5) -> list[Path]:
+def find_git_repos(
+    root_dir: Path,
+    max_depth: int = 5,
+    scanned: dict[str, int] | None = None,
+    ignore: frozenset[str] = _DEFAULT_IGNORE
+) -> list[Path]:
     """Recursively find git repositories under a root directory.
     
     Args:
         root_dir: Root directory to search
         max_depth: Maximum depth to search
+        scanned: Optional dict filled with the st_mtime_ns of every
+            non-repository directory the walk examined
+        ignore: Directory names that are never descended into
         
     Returns:
         List of paths to git repository roots
     
     """
-    repos = []
-    
     if not root_dir.is_dir():
         logger.warning(f"Root directory does not exist: {root_dir}")
-        return repos
+        return []
     
-    def search_dir(path: Path, depth: int = 0):
-        """Recursively search for git repos.
+    # Iterative depth-first walk over os.scandir. DirEntry.is_dir() answers
+    # from the directory listing itself on most platforms, so each directory
+    # costs a single listing and its entries no extra stat calls.
+    repos: list[str] = []
+    stack = [(os.fspath(root_dir), 0)]
+    
+    while stack:
+        path, depth = stack.pop()
         
-        """
-        if depth > max_depth:
-            return
+        # Stat before probing: a .git created in between bumps the mtime
+        # past the recorded value instead of going unnoticed
+        mtime_ns = None
+        if scanned is not None:
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError as e:
+                logger.debug("Error searching %s: %s", path, e)
+                scanned[path] = -1
+                continue
+        
+        if depth >= max_depth:
+            # Too deep to descend - only check whether this is a repo
+            if os.path.isdir(os.path.join(path, '.git')):
+                repos.append(path)
+            elif mtime_ns is not None:
+                scanned[path] = mtime_ns
+            continue
         
+        # One listing answers both questions: is this a git repo, and which
+        # subdirectories to descend into otherwise
+        is_repo = False
+        subdirs = []
         try:
-            # Check if this directory is a git repo
-            if is_git_repo(path):
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name == '.git':
+                        if entry.is_dir():
+                            is_repo = True
+                            break
+                    elif not name.startswith('.') and name not in ignore and entry.is_dir():
+                        subdirs.append(entry.path)
+        except OSError as e:
+            if isinstance(e, PermissionError):
+                logger.debug("Permission denied: %s", path)
+            else:
+                logger.debug("Error searching %s: %s", path, e)
+            # An unlistable directory may still be a repo
+            if os.path.isdir(os.path.join(path, '.git')):
                 repos.append(path)
-                # Don't search inside git repos
-                return
-            
-            # Search subdirectories
-            for item in path.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    search_dir(item, depth + 1)
-        except PermissionError:
-            logger.debug(f"Permission denied: {path}")
-        except Exception as e:
-            logger.debug(f"Error searching {path}: {e}")
-    
-    search_dir(root_dir)
-    return repos
+            elif scanned is not None:
+                # Never matches a real mtime, so this walk is always redone
+                scanned[path] = -1
+            continue
+        
+        # Don't search inside git repos
+        if is_repo:
+            repos.append(path)
+            continue
+        
+        if mtime_ns is not None:
+            scanned[path] = mtime_ns
+        
+        # Reversed so subdirectories are visited in listing order
+        stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+    
+    return [Path(repo) for repo in repos]
+
+
+def _bundle_index_file() -> Path | None:
+    """Get the location of the on-disk auto-discovery index.
+    
+    Returns:
+        Path to the index file, or None if ENVOY_BUNDLE_CACHE is "0" or no
+        cache directory can be determined
+    
+    """
+    if os.environ.get('ENVOY_BUNDLE_CACHE', '1') == '0':
+        return None
+    
+    if os.name == 'nt':
+        cache_dir = os.environ.get('LOCALAPPDATA')
+    else:
+        cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache'
+        )
+    
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / 'envoy' / '_bundle_cache.json'
+
+
+def _load_bundle_index(index_file: Path) -> dict:
+    """Read the auto-discovery index.
+    
+    Args:
+        index_file: Path to the index file
+        
+    Returns:
+        Mapping of resolved root path to its index entry (empty if the index
+        is missing, unreadable or from another format version)
+    
+    """
+    try:
+        with open(index_file, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(data, dict) or data.get('version') != _BUNDLE_INDEX_VERSION:
+        return {}
+    
+    roots = data.get('roots')
+    return roots if isinstance(roots, dict) else {}
+
+
+def _save_bundle_index(index_file: Path, roots: dict) -> None:
+    """Atomically write the auto-discovery index.
+    
+    Failures are logged and otherwise ignored - the index is only a cache.
+    
+    Args:
+        index_file: Path to the index file
+        roots: Mapping of resolved root path to its index entry
+    
+    """
+    import tempfile
+    
+    tmp_path = None
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=index_file.parent, prefix='.bundle_cache.', suffix='.tmp'
+        )
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'version': _BUNDLE_INDEX_VERSION, 'roots': roots}, f)
+        os.replace(tmp_path, index_file)
+    except OSError as e:
+        logger.debug("Could not write bundle index %s: %s", index_file, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _indexed_git_repos(entry, ignore: frozenset[str]) -> list[Path] | None:
+    """Get a root's git repositories from its index entry if still current.
+    
+    The entry is current when every directory the original walk examined
+    still has the recorded mtime (a directory's mtime changes whenever an
+    entry is added to or removed from it) and every recorded repository
+    still has its .git directory. An entry recorded with a different ignore
+    set is never current.
+    
+    Args:
+        entry: Index entry for the root
+        ignore: Directory names the walk would skip
+        
+    Returns:
+        List of git repository roots, or None if the walk must be redone
+    
+    """
+    try:
+        if entry['ignore'] != sorted(ignore):
+            return None
+        for path, mtime_ns in entry['dirs'].items():
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return None
+        repos = entry['repos']
+        if not all(os.path.isdir(os.path.join(repo, '.git')) for repo in repos):
+            return None
+    except (OSError, KeyError, TypeError, AttributeError):
+        return None
+    
+    return [Path(repo) for repo in repos]
+
+
+def _discovery_threads() -> int:
+    """Get the maximum number of discovery tasks run concurrently.
+    
+    Returns:
+        Value of ENVOY_DISCOVERY_THREADS, or the default if unset or invalid
+    
+    """
+    value = os.environ.get('ENVOY_DISCOVERY_THREADS')
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid ENVOY_DISCOVERY_THREADS: %s", value)
+    return _DEFAULT_DISCOVERY_THREADS
+
+
+def _discovery_ignore() -> frozenset[str]:
+    """Get the directory names skipped while walking bundle roots.
+    
+    Returns:
+        The default ignore set plus any names listed in ENVOY_DISCOVERY_IGNORE
+    
+    """
+    extra = os.environ.get('ENVOY_DISCOVERY_IGNORE')
+    if not extra:
+        return _DEFAULT_IGNORE
+    return _DEFAULT_IGNORE | {
+        name for name in map(str.strip, _IGNORE_SEP.split(extra)) if name
+    }
+
+
+def _map_io(func: Callable, items: list) -> list:
+    """Apply an I/O-bound function to each item, concurrently if worthwhile.
+    
+    Uses up to ENVOY_DISCOVERY_THREADS threads. Results keep the order of
+    items, which for roots and repos decides command precedence.
+    
+    Args:
+        func: Function to apply
+        items: Items to apply it to
+        
+    Returns:
+        List of results in item order
+    
+    """
+    workers = min(_discovery_threads(), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+
+def _walk_root(
+    root: Path,
+    entry,
+    record: bool,
+    ignore: frozenset[str]
+) -> tuple[list[Path], dict | None]:
+    """Find a root's git repositories, reusing its index entry if current.
+    
+    Args:
+        root: Resolved root directory
+        entry: The root's existing index entry, if any
+        record: Whether a fresh walk should produce a new index entry
+        ignore: Directory names that are never descended into
+        
+    Returns:
+        Tuple of (git repository roots, index entry to keep for the root).
+        The entry is None when nothing should be stored for the root.
+    
+    """
+    if entry is not None:
+        git_repos = _indexed_git_repos(entry, ignore)
+        if git_repos is not None:
+            logger.debug("Using indexed bundle walk for: %s", root)
+            return git_repos, entry
+    
+    logger.debug(f"Searching for bundles in: {root}")
+    
+    # Find all git repos under this root
+    scanned = {} if record else None
+    git_repos = find_git_repos(root, scanned=scanned, ignore=ignore)
+    
+    if scanned is not None:
+        racy_ns = time.time_ns() - _RACY_WINDOW_NS
+        if (scanned or git_repos) and all(m < racy_ns for m in scanned.values()):
+            return git_repos, {
+                'dirs': scanned,
+                'repos': [os.fspath(repo) for repo in git_repos],
+                'ignore': sorted(ignore),
+            }
+    
+    return git_repos, None
 
 
 def discover_bundles_from_roots(root_dirs: list[str]) -> list[BundleInfo]:
     """Discover bundles in specified root directories.
     
     Searches for git repositories and validates them as envoy bundles.
+    Roots are walked and repos validated concurrently (up to
+    ENVOY_DISCOVERY_THREADS at once), and walk results are kept in an
+    on-disk index (see _bundle_index_file) and reused while none of the
+    walked directories have changed.
     
     Args:
         root_dirs: List of root directory paths
         
     Returns:
-        List of discovered bundles
+        List of discovered bundles, in root order
     
     """
     bundles = []
     
-    for root_str in root_dirs:
-        root = Path(root_str).resolve()
-        logger.debug(f"Searching for bundles in: {root}")
+    index_file = _bundle_index_file()
+    index = _load_bundle_index(index_file) if index_file else {}
+    record = index_file is not None
+    ignore = _discovery_ignore()
+    
+    roots = [Path(root_str).resolve() for root_str in root_dirs]
+    
+    def walk(root: Path) -> tuple[list[Path], dict | None]:
+        return _walk_root(root, index.get(os.fspath(root)), record, ignore)
+    
+    results = _map_io(walk, roots)
+    
+    # Checking each repo for envoy_env/ is an independent stat, so those
+    # overlap across all roots too
+    all_repos = [repo for git_repos, _ in results for repo in git_repos]
+    valid = dict(zip(all_repos, _map_io(validate_bundle, all_repos)))
+    
+    index_changed = False
+    
+    for root, (git_repos, entry) in zip(roots, results):
+        root_key = os.fspath(root)
+        if entry is None:
+            if index.pop(root_key, None) is not None:
+                index_changed = True
+        elif index.get(root_key) is not entry:
+            index[root_key] = entry
+            index_changed = True
         
-        # Find all git repos under this root
-        git_repos = find_git_repos(root)
         logger.debug(f"Found {len(git_repos)} git repositories in {root}")
         
         # Validate each repo as a bundle
         for repo_path in git_repos:
-            if validate_bundle(repo_path):
+            if valid[repo_path]:
                 bundle = BundleInfo(
                     root=repo_path,
                     name=repo_path.name
@@ -178,6 +502,9 @@ def discover_bundles_from_roots(root_dirs: list[str]) -> list[BundleInfo]:
             else:
                 logger.debug(f"Git repo is not an envoy bundle: {repo_path}")
     
+    if index_changed:
+        _save_bundle_index(index_file, index)
+    
     return bundles
 
 
@@ -240,8 +567,9 @@ def load_bundles_from_config(config_file: Path) -> list[BundleInfo]:
         raise WrapperError(f"Config file not found: {config_file}")
     
     try:
-        with open(config_file, 'r') as f:
-            data = json.load(f)
+        with open(config_file, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError as e:
         raise WrapperError(f"Invalid JSON in config file: {e}")
     except Exception as e:
@@ -4,11 +4,17 @@ import os
 import json
 import re
 import logging
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from ._exceptions import WrapperError
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; the stdlib parser is the fallback.
+    orjson = None
+
 
 log = logging.getLogger(__name__)
 
@@ -80,9 +86,90 @@ _CORE_ENV_VARS: frozenset[str] = frozenset({
 _ENVOY_ENV_VARS: frozenset[str] = frozenset({
     'ENVOY_BNDL_ROOTS',
     'ENVOY_ALLOWLIST',
+    'ENVOY_BUNDLE_CACHE',
+    'ENVOY_DISCOVERY_THREADS',
+    'ENVOY_DISCOVERY_IGNORE',
+})
+
+# Key prefixes for the append / prepend operators.
+_OP_APPEND = '+='
+_OP_PREPEND = '^='
+
+# Matches {$VARNAME} references inside env file values. Special variables
+# ({$__NAME__}) are captured in their own group so the replacer knows up front
+# which mapping to consult.
+_VAR_PATTERN = re.compile(
+    r'\{\$(?:(?P<special>__[A-Za-z0-9_]*__)|(?P<name>[A-Za-z_][A-Za-z0-9_]*))\}'
+)
+
+# Translation table for normalize_path. None on platforms that already use
+# forward slashes, so the call is a no-op there.
+_NATIVE_SEP_TABLE: dict[int, int] | None = (
+    str.maketrans('/', '\\') if os.name == 'nt' else None
+)
+
+# Separator used to join list values and += / ^= segments.
+_PATH_SEP = ';' if os.name == 'nt' else ':'
+
+# Locates the bundle's envoy_env/ directory inside a resolved env file path.
+_ENVOY_ENV_MARKER = f"{os.sep}envoy_env{os.sep}"
+
+# Special variables keyed by absolute env file path. The bundle layout a file
+# sits in doesn't change during a session, so each file is resolved once.
+_SPECIAL_VARS_CACHE: dict[str, dict[str, str]] = {}
+
+# Parsed env file contents keyed by absolute path. Each entry records the
+# (st_mtime_ns, st_size) it was read at so edits are picked up on next load.
+_ENV_FILE_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
+# Names provided by EnvironmentManager.get_special_variables.
+_SPECIAL_VAR_NAMES: frozenset[str] = frozenset({
+    '__FILE__',
+    '__BUNDLE__',
+    '__BUNDLE_ENV__',
+    '__BUNDLE_NAME__',
 })
 
 
+def clear_env_file_cache() -> None:
+    """Forget every parsed env file and resolved set of special variables.
+    
+    Both caches grow with each distinct env file path loaded. Long-running
+    hosts that load many short-lived files can call this to release them;
+    the next load simply reads and resolves the files again.
+    
+    """
+    _ENV_FILE_CACHE.clear()
+    _SPECIAL_VARS_CACHE.clear()
+
+
+class _LazySpecialVars:
+    """Special variables for one env file, resolved on first lookup.
+    
+    Most env files never reference a special variable, so the path resolution
+    and string conversion behind get_special_variables is deferred until a
+    {$__NAME__} reference actually needs it.
+    
+    """
+    
+    __slots__ = ('_path', '_vars')
+    
+    def __init__(self, path: Path):
+        self._path = path
+        self._vars: dict[str, str] | None = None
+    
+    def _resolve(self) -> dict[str, str]:
+        if self._vars is None:
+            self._vars = EnvironmentManager.get_special_variables(self._path)
+        return self._vars
+    
+    def __contains__(self, name: object) -> bool:
+        return name in _SPECIAL_VAR_NAMES and name in self._resolve()
+    
+    def __getitem__(self, name: str) -> str:
+        return self._resolve()[name]
+
+
 class EnvironmentManager:
     """Manages environment variable loading, expansion, and preparation.
     
@@ -103,7 +190,7 @@ class EnvironmentManager:
     
     """
     
-    def __init__(self, inherit_env: bool = False, allowlist: set[str] | None = None):
+    def __init__(self, inherit_env: bool = False, allowlist: set[str] | frozenset[str] | None = None):
         """Initialize the environment manager.
         
         Args:
@@ -115,13 +202,20 @@ class EnvironmentManager:
             
         """
         self.inherit_env = inherit_env
-        self.allowlist = allowlist or set()
+        self.allowlist = allowlist or frozenset()
+        # Last env file merge as (file stamps, base_env, result), reused by
+        # prepare_environment while neither the files nor the base change
+        self._files_env: tuple[tuple, dict[str, str], dict[str, str]] | None = None
+        
+        # Variables seeded from os.environ in closed mode, built once here
+        # rather than unioned on every prepare_environment call
+        self._seed_vars: frozenset[str] = _CORE_ENV_VARS | _ENVOY_ENV_VARS | self.allowlist
     
     @staticmethod
     def expand_env_value(
         value: str, 
         current_env: dict[str, str],
-        special_vars: dict[str, str] | None = None
+        special_vars: Mapping[str, str] | None = None
     ) -> str:
         """Expand environment variable references in a value string.
         
@@ -151,24 +245,27 @@ class EnvironmentManager:
             Expanded string value
             
         """
-        # Pattern to match {$VARNAME}
-        pattern = re.compile(r'\{\$([A-Za-z_][A-Za-z0-9_]*)\}')
+        # Most values are plain literals — skip the regex engine entirely.
+        if '{$' not in value:
+            return value
+        
+        env_get = current_env.get
         
         def replacer(match):
-            var_name = match.group(1)
+            kind = match.lastgroup
+            var_name = match.group(kind)
             
-            # Check special variables first (highest priority)
+            # Check special variables first (highest priority). Callers may
+            # pass plain names here too, so every reference is looked up;
+            # _LazySpecialVars answers plain names without resolving.
             if special_vars and var_name in special_vars:
                 return special_vars[var_name]
             
-            # Check current_env second
-            if var_name in current_env:
-                return current_env[var_name]
-            
-            # Unresolved — return empty string (never read from os.environ here).
-            return ''
+            # Check current_env second. Unresolved references become an empty
+            # string (never read from os.environ here).
+            return env_get(var_name, '')
         
-        return pattern.sub(replacer, value)
+        return _VAR_PATTERN.sub(replacer, value)
     
     @staticmethod
     def normalize_path(path: str) -> str:
@@ -184,16 +281,16 @@ class EnvironmentManager:
             Normalized path for the current OS
             
         """
-        if os.name == 'nt':
+        if _NATIVE_SEP_TABLE is not None:
             # On Windows, convert forward slashes to backslashes
-            return path.replace('/', '\\')
+            return path.translate(_NATIVE_SEP_TABLE)
         return path
     
     def process_env_value(
         self, 
         value: Any, 
         merged_env: dict[str, str],
-        special_vars: dict[str, str] | None = None
+        special_vars: Mapping[str, str] | None = None
     ) -> str:
         """Process an environment variable value from JSON.
         
@@ -213,13 +310,10 @@ class EnvironmentManager:
             Processed string value
             
         """
-        # Determine path separator based on OS
-        path_sep = ';' if os.name == 'nt' else ':'
-        
         # Handle list values - join with path separator
         if isinstance(value, list):
             # Keep paths in UNIX style (forward slashes) for consistency
-            str_value = path_sep.join(str(item) for item in value)
+            str_value = _PATH_SEP.join(map(str, value))
         else:
             # Convert to string, keep as-is
             str_value = str(value)
@@ -238,41 +332,71 @@ class EnvironmentManager:
             __BUNDLE_ENV__  - The envoy_env/ directory itself
             __BUNDLE_NAME__ - Name of the bundle (directory name)
             env_file_path: Path to the environment JSON file
+        
+        Results are cached per absolute file path, so repeated loads of the
+        same file (e.g. a shared global_env.json) skip the resolve and walk.
             
         Returns:
             Dictionary of special variable names and their values
             
         """
-        env_file_abs = env_file_path.resolve()
-        
-        # Try to find the envoy_env/ directory by walking up the path
-        current = env_file_abs.parent
-        package_env_dir = None
-        package_root = None
-        
-        # Look for 'envoy_env' directory in the path
-        for parent in [current] + list(current.parents):
-            if parent.name == 'envoy_env':
-                package_env_dir = parent
-                package_root = parent.parent
-                break
-        
-        # If no envoy_env/ directory found, use file's parent as bundle root
-        if package_root is None:
-            package_root = env_file_abs.parent
-            package_env_dir = package_root
+        cache_key = os.path.abspath(env_file_path)
+        cached = _SPECIAL_VARS_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
+        env_file_abs = os.path.realpath(env_file_path)
+        
+        # Find the nearest envoy_env/ directory in the path with a single
+        # search from the right (env files almost always sit directly in it)
+        marker_at = env_file_abs.rfind(_ENVOY_ENV_MARKER)
+        if marker_at >= 0:
+            package_env_dir = env_file_abs[:marker_at + len(_ENVOY_ENV_MARKER) - 1]
+            package_root = os.path.dirname(package_env_dir)
+        else:
+            # If no envoy_env/ directory found, use file's parent as bundle root
+            package_root = package_env_dir = os.path.dirname(env_file_abs)
         
         # Convert to cross-platform paths (keep forward slashes - will be normalized later)
         # The paths will use forward slashes internally and get normalized
         # to backslashes on Windows during normalize_path processing
         special_vars = {
-            '__FILE__': str(env_file_abs).replace('\\', '/'),
-            '__BUNDLE__': str(package_root).replace('\\', '/'),
-            '__BUNDLE_ENV__': str(package_env_dir).replace('\\', '/'),
-            '__BUNDLE_NAME__': package_root.name,
+            '__FILE__': env_file_abs.replace('\\', '/'),
+            '__BUNDLE__': package_root.replace('\\', '/'),
+            '__BUNDLE_ENV__': package_env_dir.replace('\\', '/'),
+            '__BUNDLE_NAME__': os.path.basename(package_root),
         }
         
-        return special_vars
+        _SPECIAL_VARS_CACHE[cache_key] = special_vars
+        return dict(special_vars)
+    
+    @staticmethod
+    def _read_env_file(path: Path) -> Any:
+        """Read and parse an env file, reusing the last parse if unchanged.
+        
+        The returned object is shared with the cache and must not be modified.
+        
+        Args:
+            path: Path to the environment JSON file
+            
+        Returns:
+            The decoded JSON document
+            
+        """
+        cache_key = os.path.abspath(path)
+        st = os.stat(cache_key)
+        stamp = (st.st_mtime_ns, st.st_size)
+        
+        cached = _ENV_FILE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        with open(cache_key, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        _ENV_FILE_CACHE[cache_key] = (stamp, data)
+        return data
     
     def load_env_from_files(
         self, 
@@ -304,8 +428,8 @@ class EnvironmentManager:
             env_files: Single file path or list of file paths to load
             base_env: Variables already in scope before any file is processed.
                 Used for {$VARNAME} expansion and as the starting point for +=
-                and ^= operators.  Should be os.environ.copy() in inherit-env
-                mode, or the allowlist-seeded dict in closed mode.  Never
+                and ^= operators.  Should be a snapshot of os.environ in
+                inherit-env mode, or the allowlist-seeded dict in closed mode.  Never
                 modified — a copy is taken before file processing begins.
             
         Returns:
@@ -323,26 +447,31 @@ class EnvironmentManager:
         if isinstance(env_files, (str, Path)):
             env_files = [env_files]
         
-        # Determine path separator based on OS
-        path_sep = ';' if os.name == 'nt' else ':'
-        
         # Seed from base_env so {$VAR} references and += operators see whatever
         # variables are legitimately in scope (allowlist or full system env).
         # A copy is taken so the caller's dict is never modified.
         merged_env: dict[str, str] = dict(base_env) if base_env else {}
         
+        # += / ^= build values up piece by piece. Rebuilding the string on
+        # every operator is quadratic across long chains of files, so the
+        # pieces are kept per variable and joined into merged_env only when a
+        # value is about to be expanded against it, and once at the end.
+        segments: dict[str, deque[str]] = {}
+        stale: set[str] = set()
+        
+        def flush_segments() -> None:
+            for name in stale:
+                merged_env[name] = _PATH_SEP.join(segments[name])
+            stale.clear()
+        
         for file_path in env_files:
             path = Path(file_path)
             
-            if not path.exists():
-                raise WrapperError(f"Environment file not found: {path}")
-            
-            # Calculate special variables for this file
-            special_vars = self.get_special_variables(path)
+            # Special variables for this file, resolved only if referenced
+            special_vars = _LazySpecialVars(path)
             
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    file_env = json.load(f)
+                file_env = self._read_env_file(path)
                 
                 if not isinstance(file_env, dict):
                     raise WrapperError(
@@ -351,51 +480,100 @@ class EnvironmentManager:
                 
                 # Process each key-value pair
                 for key, value in file_env.items():
-                    # Check for operators
-                    append_mode = False
-                    prepend_mode = False
-                    var_name = key
-                    
-                    if key.startswith('+='):
-                        append_mode = True
-                        var_name = key[2:]  # Remove += prefix
-                    elif key.startswith('^='):
-                        prepend_mode = True
-                        var_name = key[2:]  # Remove ^= prefix
+                    # Check for operators with a single prefix slice
+                    op = key[:2]
+                    append_mode = op == _OP_APPEND
+                    prepend_mode = op == _OP_PREPEND
+                    var_name = key[2:] if append_mode or prepend_mode else key
                     
-                    # Process the value (handles lists, normalization, expansion)
-                    processed_value = self.process_env_value(value, merged_env, special_vars)
+                    # Process the value (handles lists, normalization, expansion).
+                    # Plain string literals are by far the most common value and
+                    # need none of that, so they are stored as-is.
+                    if type(value) is str and '{$' not in value:
+                        processed_value = value
+                    else:
+                        if stale:
+                            flush_segments()
+                        processed_value = self.process_env_value(value, merged_env, special_vars)
                     
                     # Handle append/prepend operations
                     if append_mode or prepend_mode:
-                        # Only look in merged_env — never fall back to os.environ.
-                        # If the variable isn't defined yet it's treated as empty,
-                        # making += and ^= equivalent to a plain assignment on first use.
-                        current_value = merged_env.get(var_name, '')
+                        parts = segments.get(var_name)
+                        if parts is None:
+                            # Only look in merged_env — never fall back to os.environ.
+                            # If the variable isn't defined yet it's treated as empty,
+                            # making += and ^= equivalent to a plain assignment on first use.
+                            current_value = merged_env.get(var_name, '')
+                            parts = segments[var_name] = deque([current_value] if current_value else ())
                         
-                        if append_mode:
+                        if not parts or (len(parts) == 1 and not parts[0]):
+                            # Current value is empty: behaves like an assignment
+                            parts.clear()
+                            parts.append(processed_value)
+                        elif append_mode:
                             # Append: current + separator + new
-                            if current_value:
-                                merged_env[var_name] = f"{current_value}{path_sep}{processed_value}"
-                            else:
-                                merged_env[var_name] = processed_value
+                            parts.append(processed_value)
                         else:  # prepend_mode
                             # Prepend: new + separator + current
-                            if current_value:
-                                merged_env[var_name] = f"{processed_value}{path_sep}{current_value}"
-                            else:
-                                merged_env[var_name] = processed_value
+                            parts.appendleft(processed_value)
+                        stale.add(var_name)
                     else:
                         # Normal assignment - just set the value
                         merged_env[var_name] = processed_value
+                        if var_name in segments:
+                            del segments[var_name]
+                            stale.discard(var_name)
                 
-                log.info(f"Loaded {len(file_env)} environment variables from {path}")
+                log.info("Loaded %d environment variables from %s", len(file_env), path)
                 
+            except FileNotFoundError as e:
+                # Raised by the stat in _read_env_file — no separate exists() check
+                raise WrapperError(f"Environment file not found: {path}") from e
             except json.JSONDecodeError as e:
                 raise WrapperError(f"Invalid JSON in environment file {path}: {e}") from e
             except Exception as e:
                 raise WrapperError(f"Error reading environment file {path}: {e}") from e
         
+        flush_segments()
+        return merged_env
+    
+    def _merge_env_files(
+        self,
+        env_files: str | Path | list[str | Path],
+        base_env: dict[str, str],
+    ) -> dict[str, str]:
+        """Return load_env_from_files(env_files, base_env), reusing the last merge.
+        
+        A wrapper run repeatedly with the same env files redoes the whole
+        expansion and operator pass otherwise, even though the parsed JSON
+        is already cached. The merge is reused while every file keeps its
+        (mtime_ns, size) stat and base_env compares equal.
+        
+        Args:
+            env_files: Single file path or list of file paths to load
+            base_env: Variables in scope before any file is processed
+            
+        Returns:
+            A new dictionary the caller is free to modify
+            
+        """
+        paths = [env_files] if isinstance(env_files, (str, Path)) else env_files
+        try:
+            stamps = tuple(
+                (abs_path, st.st_mtime_ns, st.st_size)
+                for abs_path in map(os.path.abspath, paths)
+                for st in (os.stat(abs_path),)
+            )
+        except OSError:
+            # Let load_env_from_files report the missing file
+            return self.load_env_from_files(env_files, base_env=base_env)
+        
+        cached = self._files_env
+        if cached is not None and cached[0] == stamps and cached[1] == base_env:
+            return dict(cached[2])
+        
+        merged_env = self.load_env_from_files(env_files, base_env=base_env)
+        self._files_env = (stamps, base_env, dict(merged_env))
         return merged_env
     
     def prepare_environment(
@@ -419,25 +597,30 @@ class EnvironmentManager:
             
         """
         if self.inherit_env:
-            # Inherit-env: start with the full system environment
-            result_env = os.environ.copy()
+            # Inherit-env: start with the full system environment. It is read
+            # on every call so changes made between runs (pre_run hooks
+            # included) are seen, as they are when Popen inherits it directly.
+            result_env = dict(os.environ)
         else:
             # Closed: always seed core OS variables first, then the user allowlist.
             # Core vars (identity, temp, system paths, locale, etc.) are safe to
             # carry through unconditionally and their absence tends to break tools
             # in unexpected ways.  Envoy's own vars are included so child processes
             # that invoke envoy again inherit the same discovery context.
-            result_env = {}
-            for var in _CORE_ENV_VARS | _ENVOY_ENV_VARS | self.allowlist:
-                if var in os.environ:
-                    result_env[var] = os.environ[var]
+            environ_get = os.environ.get
+            result_env = {
+                var: value for var in self._seed_vars
+                if (value := environ_get(var)) is not None
+            }
         
         # Load from files (overrides inherited/seeded env).
         # Pass result_env as base_env so {$VAR} expansion and += / ^= operators
         # inside env files see exactly the same variables that will be in scope —
         # no silent leakage of system variables that aren't in base_env.
-        file_env = self.load_env_from_files(env_files, base_env=result_env)
-        result_env.update(file_env)
+        # The returned dict already contains every base_env entry, so it
+        # replaces result_env instead of being merged back into it.
+        if env_files:
+            result_env = self._merge_env_files(env_files, result_env)
         
         # Explicit env dict overrides everything
         if env:
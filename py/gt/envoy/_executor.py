@@ -1,10 +1,15 @@
 """Process execution handling for ApplicationWrapper."""
 
 import os
+import codecs
+import select
 import sys
 import subprocess
 import shutil
+import signal
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Callable
 
@@ -13,6 +18,41 @@ from ._exceptions import WrapperError
 
 log = logging.getLogger(__name__)
 
+# shutil.which hits keyed by (executable, PATH searched, PATHEXT). PATH
+# scans are repeated for every run otherwise, and on Windows each directory
+# is probed once per PATHEXT extension. Only successful lookups are kept,
+# and the least recently used entry is dropped beyond _WHICH_CACHE_SIZE.
+_WHICH_CACHE: dict[tuple[str, str, str], str] = {}
+_WHICH_CACHE_SIZE = 128
+
+# Bumped by clear_executable_cache so every executor's prepare_command memo
+# is invalidated along with the shared lookups.
+_resolution_generation = 0
+
+# Maximum bytes taken from a pipe per read while streaming output.
+_READ_SIZE = 65536
+
+# Seconds between interrupt flag checks while waiting on a process.
+_INTERRUPT_POLL_INTERVAL = 0.1
+
+# os.pidfd_open (Linux 5.3+, Python 3.9+) lets waits block on child exit
+# instead of polling waitpid; None where unavailable.
+_pidfd_open = getattr(os, 'pidfd_open', None)
+
+
+def clear_executable_cache() -> None:
+    """Forget every cached executable lookup.
+    
+    Lookups are otherwise reused for as long as the result still exists, so
+    an executable installed later in an earlier PATH directory is not picked
+    up. Long-running hosts should call this after changing what is on PATH.
+    Resolutions remembered by existing wrappers are dropped as well.
+    
+    """
+    global _resolution_generation
+    _resolution_generation += 1
+    _WHICH_CACHE.clear()
+
 
 class ProcessExecutor:
     """Handles subprocess execution, output streaming, and process control.
@@ -30,7 +70,12 @@ class ProcessExecutor:
         self,
         stream_output: bool = True,
         on_output: Callable[[str], None] | None = None,
-        on_error: Callable[[str], None] | None = None
+        on_error: Callable[[str], None] | None = None,
+        capture_output: bool = True,
+        max_captured_bytes: int | None = None,
+        on_output_batch: Callable[[list[str]], None] | None = None,
+        on_error_batch: Callable[[list[str]], None] | None = None,
+        new_process_group: bool = False,
     ):
         """Initialize the process executor.
         
@@ -38,11 +83,28 @@ class ProcessExecutor:
             stream_output: Whether to stream output to stdout/stderr
             on_output: Callback for stdout lines
             on_error: Callback for stderr lines
+            capture_output: Whether to return the output read from the pipes
+            max_captured_bytes: Keep only the last this many bytes of each
+                captured stream (None keeps everything)
+            on_output_batch: Callback for the stdout lines of each read
+            on_error_batch: Callback for the stderr lines of each read
+            new_process_group: Whether processes are started in their own
+                session, so termination signals their whole process group
             
         """
         self.stream_output = stream_output
         self.on_output = on_output
         self.on_error = on_error
+        self.capture_output = capture_output
+        self.max_captured_bytes = max_captured_bytes
+        self.on_output_batch = on_output_batch
+        self.on_error_batch = on_error_batch
+        self.new_process_group = new_process_group
+        
+        # Last bare (executable, search_path, generation) resolved on PATH
+        # by prepare_command and its result, so repeated runs of the same
+        # wrapper skip resolution until the lookup cache is cleared.
+        self._resolved: tuple[tuple[str, str | None, int], str] | None = None
     
     @staticmethod
     def resolve_executable(executable: str | Path, search_path: str | None = None) -> str:
@@ -70,12 +132,27 @@ class ProcessExecutor:
             return os.path.abspath(exe)
         
         # Search in the subprocess PATH (or system PATH if not provided)
-        found = shutil.which(exe, path=search_path)
+        if search_path is None:
+            search_path = os.environ.get('PATH', os.defpath)
+        cache_key = (exe, search_path, os.environ.get('PATHEXT', ''))
+        found = _WHICH_CACHE.pop(cache_key, None)
+        if found is None or not os.path.isfile(found):
+            # Not cached, or the cached file has gone - search again
+            found = shutil.which(exe, path=search_path)
         if found:
+            # Re-inserting keeps the dict in least recently used order
+            _WHICH_CACHE[cache_key] = found
+            if len(_WHICH_CACHE) > _WHICH_CACHE_SIZE:
+                _WHICH_CACHE.pop(next(iter(_WHICH_CACHE)), None)
             return found
         
         raise WrapperError(f"Executable '{exe}' not found in PATH")
     
+    def clear_resolution_cache(self) -> None:
+        """Forget cached executable lookups, see clear_executable_cache."""
+        self._resolved = None
+        clear_executable_cache()
+    
     def prepare_command(
         self, 
         executable: str | Path, 
@@ -95,80 +172,440 @@ class ProcessExecutor:
             List of command components
             
         """
-        exe = self.resolve_executable(executable, search_path=search_path)
-        return [exe] + list(args)
+        exe = str(executable)
+        if os.path.isabs(exe) or os.path.dirname(exe):
+            # Path-like executables are cheap to resolve but depend on the
+            # current directory and must still exist, so they are checked
+            # on every run rather than memoized.
+            return [self.resolve_executable(exe), *args]
+        
+        key = (exe, search_path, _resolution_generation)
+        if self._resolved is not None and self._resolved[0] == key:
+            exe = self._resolved[1]
+        else:
+            exe = self.resolve_executable(exe, search_path=search_path)
+            self._resolved = (key, exe)
+        return [exe, *args]
+    
+    def _pump_stream(
+        self,
+        stream,
+        sink: bytearray | None,
+        echo_to,
+        callback: Callable[[str], None] | None,
+        callback_name: str,
+        batch_callback: Callable[[list[str]], None] | None = None,
+    ) -> None:
+        """Read one pipe until EOF, collecting and dispatching its output.
+        
+        Args:
+            stream: Unbuffered binary pipe to read from
+            sink: Buffer every byte read is appended to, decoded once at the
+                end, or None to not keep the output
+            echo_to: Text stream to echo output to, or None to not echo
+            callback: Optional per-line callback
+            callback_name: Callback name used in warning messages
+            batch_callback: Optional callback receiving every complete line
+                of a read in one list, instead of one call per line
+            
+        """
+        limit = self.max_captured_bytes
+        wants_lines = callback is not None or batch_callback is not None
+        if echo_to is None and not wants_lines and limit is None:
+            # Capture only: nothing needs individual lines while the process
+            # runs, so read to EOF in one call.
+            data = stream.read()
+            if data:
+                sink.extend(data)
+            return
+        
+        echo = self._byte_echo(echo_to) if echo_to is not None else None
+        
+        def dispatch(raw_lines: list[bytes]) -> None:
+            lines = [line.decode('utf-8', errors='replace').rstrip() for line in raw_lines]
+            if callback is not None:
+                for line in lines:
+                    try:
+                        callback(line)
+                    except Exception as e:
+                        log.warning("%s callback error: %s", callback_name, e)
+            if batch_callback is not None:
+                try:
+                    batch_callback(lines)
+                except Exception as e:
+                    log.warning("%s_batch callback error: %s", callback_name, e)
+        
+        # Read whatever is available in large blocks, rather than one
+        # readline call per line. os.read returns as soon as any data
+        # arrives, so output is still delivered promptly. Only the callback
+        # needs individual lines; capture keeps the raw bytes.
+        fd = stream.fileno()
+        read = os.read
+        sink_extend = sink.extend if sink is not None else None
+        # A bounded sink is trimmed once it holds twice the limit, so the
+        # tail is copied down once per limit bytes read rather than per read.
+        trim_at = 2 * limit if limit is not None else None
+        trimmed = False
+        pending = b''
+        ends_line = True
+        while True:
+            chunk = read(fd, _READ_SIZE)
+            if not chunk:
+                break
+            if sink_extend is not None:
+                sink_extend(chunk)
+                if trim_at is not None and len(sink) > trim_at:
+                    del sink[:-limit]
+                    trimmed = True
+            if echo is not None:
+                # Echo the block as read - one write per read rather than
+                # per line, and partial lines (progress output) show up
+                # without waiting for their newline.
+                echo(chunk)
+                ends_line = chunk.endswith(b'\n')
+            if wants_lines:
+                *complete, pending = (pending + chunk).split(b'\n')
+                if complete:
+                    dispatch(complete)
+        
+        # Final line without a trailing newline
+        if pending:
+            dispatch([pending])
+        if not ends_line:
+            echo(b'\n')
+        
+        if trim_at is not None and sink is not None and (trimmed or len(sink) > limit):
+            del sink[:-limit]
+            # Start the capture on a whole line where the window allows
+            newline = sink.find(b'\n')
+            if 0 <= newline < len(sink) - 1:
+                del sink[:newline + 1]
     
-    def stream_process_output(self, process: subprocess.Popen) -> tuple[str, str]:
-        """Stream output from process in real-time.
+    @staticmethod
+    def _capture_text(data: bytes | bytearray | None) -> str:
+        """Decode captured pipe output into newline-joined, right-stripped lines.
+        
+        Args:
+            data: Everything read from the pipe, or None if it was not piped
+            
+        Returns:
+            The captured lines without a trailing newline
+            
+        """
+        if not data:
+            return ''
+        text = data.decode('utf-8', errors='replace')
+        if text.endswith('\n'):
+            text = text[:-1]
+        return '\n'.join(map(str.rstrip, text.split('\n')))
+    
+    @staticmethod
+    def _byte_echo(echo_to) -> Callable[[bytes], None]:
+        """Return a function writing raw pipe output to echo_to.
+        
+        Output is forwarded as the bytes read from the pipe when echo_to
+        exposes a binary buffer, so echoing costs no re-encode and a single
+        write per read. Text streams without one get incrementally decoded
+        text, so characters split across reads are not mangled.
+        
+        Args:
+            echo_to: Text stream to echo output to
+            
+        Returns:
+            Callable taking a block of bytes read from the pipe
+            
+        """
+        buffer = getattr(echo_to, 'buffer', None)
+        if buffer is None:
+            decode = codecs.getincrementaldecoder('utf-8')(errors='replace').decode
+            
+            def echo(data: bytes) -> None:
+                echo_to.write(decode(data))
+                echo_to.flush()
+            return echo
+        
+        # Anything already written through the text layer goes out first.
+        echo_to.flush()
+        
+        def echo(data: bytes) -> None:
+            buffer.write(data)
+            buffer.flush()
+        return echo
+    
+    def wait_process(
+        self,
+        process: subprocess.Popen,
+        timeout: float | None = None,
+        interrupted: Callable[[], bool] | None = None,
+    ) -> int:
+        """Wait for a process to exit, honoring a timeout and an interrupt flag.
+        
+        When interrupted is given, the wait runs in short slices and checks
+        it between them. Signal handlers only need to set a flag; the process
+        is then terminated here, outside the handler. Without it the wait is
+        a plain blocking wait.
         
         Args:
             process: Running subprocess
+            timeout: Seconds to wait for the process to exit (None waits forever)
+            interrupted: Callable returning True once the run should stop
             
         Returns:
-            Tuple of (stdout, stderr) as strings
+            The process return code
+            
+        Raises:
+            subprocess.TimeoutExpired: If the process did not exit in time
             
         """
-        stdout_lines = []
-        stderr_lines = []
+        if interrupted is None and timeout is None:
+            return process.wait()
         
-        # Read stdout
-        if process.stdout:
-            for line in iter(process.stdout.readline, b''):
-                if not line:
-                    break
-                decoded = line.decode('utf-8', errors='replace').rstrip()
-                stdout_lines.append(decoded)
-                
-                if self.stream_output:
-                    print(decoded, file=sys.stdout, flush=True)
+        # Popen.wait(timeout=...) polls waitpid with sleeps of up to 50 ms,
+        # which delays noticing a short-lived child's exit. A pidfd becomes
+        # readable the moment the child exits, so select() on it instead.
+        pidfd = self._open_pidfd(process)
+        try:
+            if interrupted is None:
+                return self._wait_slice(process, pidfd, timeout)
+            
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                if interrupted():
+                    log.warning("Interrupted, terminating process...")
+                    self.terminate_process(process, group=self.new_process_group)
+                    return process.wait()
                 
-                if self.on_output:
-                    try:
-                        self.on_output(decoded)
-                    except Exception as e:
-                        log.warning(f"on_output callback error: {e}")
+                wait_for = _INTERRUPT_POLL_INTERVAL
+                if deadline is not None:
+                    wait_for = min(wait_for, max(deadline - time.monotonic(), 0.0))
+                try:
+                    return self._wait_slice(process, pidfd, wait_for)
+                except subprocess.TimeoutExpired:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        raise subprocess.TimeoutExpired(process.args, timeout) from None
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+    
+    @staticmethod
+    def _open_pidfd(process: subprocess.Popen) -> int | None:
+        """Open a pidfd for a running child where the platform supports it.
+        
+        Args:
+            process: Running subprocess
+            
+        Returns:
+            The pidfd, or None on platforms or kernels without pidfd_open
+            
+        """
+        if _pidfd_open is None or process.returncode is not None:
+            return None
+        try:
+            return _pidfd_open(process.pid)
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _wait_slice(process: subprocess.Popen, pidfd: int | None, timeout: float) -> int:
+        """Wait up to timeout seconds for a process to exit.
+        
+        Args:
+            process: Running subprocess
+            pidfd: pidfd for the process from _open_pidfd, or None
+            timeout: Seconds to wait
+            
+        Returns:
+            The process return code
+            
+        Raises:
+            subprocess.TimeoutExpired: If the process did not exit in time
+            
+        """
+        if pidfd is None:
+            return process.wait(timeout=timeout)
+        
+        ready, _, _ = select.select((pidfd,), (), (), timeout)
+        if not ready:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        # The child has exited, so reaping it does not block
+        return process.wait()
+    
+    def stream_process_output(
+        self,
+        process: subprocess.Popen,
+        timeout: float | None = None,
+        interrupted: Callable[[], bool] | None = None,
+    ) -> tuple[str, str]:
+        """Stream output from process in real-time and wait for it to exit.
+        
+        stdout and stderr are drained concurrently, one thread per pipe, so a
+        child that fills one pipe while envoy is blocked reading the other
+        cannot deadlock. The line callbacks are therefore invoked from
+        those reader threads. The timeout is enforced while output is still
+        being drained, not after EOF.
+        
+        Args:
+            process: Running subprocess
+            timeout: Seconds to wait for the process to exit (None waits forever)
+            interrupted: Interrupt flag check, see wait_process
+            
+        Returns:
+            Tuple of (stdout, stderr) as strings
+            
+        Raises:
+            subprocess.TimeoutExpired: If the process did not exit in time. The
+                process has been terminated and the exception carries the
+                output collected so far in its output / stderr attributes.
+            
+        """
+        if (not self.stream_output and self.on_output is None and self.on_error is None
+                and self.on_output_batch is None and self.on_error_batch is None
+                and self.max_captured_bytes is None):
+            return self._communicate(process, timeout=timeout, interrupted=interrupted)
+        
+        # Captured output goes into one growable byte buffer per pipe and is
+        # decoded in a single pass once the pipe is drained. Without capture
+        # the pipes only feed echo and callbacks, so nothing is kept.
+        keep = self.capture_output and self.max_captured_bytes != 0
+        stdout_buffer = bytearray() if keep else None
+        stderr_buffer = bytearray() if keep else None
         
-        # Read stderr
+        pumps = []
+        if process.stdout:
+            pumps.append(threading.Thread(
+                target=self._pump_stream,
+                args=(
+                    process.stdout,
+                    stdout_buffer,
+                    sys.stdout if self.stream_output else None,
+                    self.on_output,
+                    'on_output',
+                    self.on_output_batch,
+                ),
+                daemon=True,
+            ))
         if process.stderr:
-            for line in iter(process.stderr.readline, b''):
-                if not line:
-                    break
-                decoded = line.decode('utf-8', errors='replace').rstrip()
-                stderr_lines.append(decoded)
-                
-                if self.stream_output:
-                    print(decoded, file=sys.stderr, flush=True)
-                
-                if self.on_error:
-                    try:
-                        self.on_error(decoded)
-                    except Exception as e:
-                        log.warning(f"on_error callback error: {e}")
+            pumps.append(threading.Thread(
+                target=self._pump_stream,
+                args=(
+                    process.stderr,
+                    stderr_buffer,
+                    sys.stderr if self.stream_output else None,
+                    self.on_error,
+                    'on_error',
+                    self.on_error_batch,
+                ),
+                daemon=True,
+            ))
+        
+        for pump in pumps:
+            pump.start()
         
-        return '\n'.join(stdout_lines), '\n'.join(stderr_lines)
+        try:
+            self.wait_process(process, timeout=timeout, interrupted=interrupted)
+        except subprocess.TimeoutExpired as e:
+            # Killing the child closes its end of the pipes, which lets the
+            # readers reach EOF and hand back whatever was produced.
+            self.terminate_process(process, group=self.new_process_group)
+            for pump in pumps:
+                pump.join()
+            e.output = self._capture_text(stdout_buffer)
+            e.stderr = self._capture_text(stderr_buffer)
+            raise
+        
+        for pump in pumps:
+            pump.join()
+        
+        return self._capture_text(stdout_buffer), self._capture_text(stderr_buffer)
+    
+    def _communicate(
+        self,
+        process: subprocess.Popen,
+        timeout: float | None = None,
+        interrupted: Callable[[], bool] | None = None,
+    ) -> tuple[str, str]:
+        """Collect output with Popen.communicate when nothing consumes lines.
+        
+        With no echo and no callbacks the output is only needed once the
+        process exits, so subprocess can gather both pipes itself instead
+        of envoy running a reader thread per pipe. Behaves like
+        stream_process_output otherwise.
+        
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if interrupted is not None and interrupted():
+                log.warning("Interrupted, terminating process...")
+                self.terminate_process(process, group=self.new_process_group)
+                stdout, stderr = process.communicate()
+                break
+            
+            if interrupted is None:
+                wait_for = timeout
+            else:
+                wait_for = _INTERRUPT_POLL_INTERVAL
+                if deadline is not None:
+                    wait_for = min(wait_for, max(deadline - time.monotonic(), 0.0))
+            try:
+                stdout, stderr = process.communicate(timeout=wait_for)
+                break
+            except subprocess.TimeoutExpired:
+                # Output read so far is kept by communicate() for the retry.
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.terminate_process(process, group=self.new_process_group)
+                    stdout, stderr = process.communicate()
+                    raise subprocess.TimeoutExpired(
+                        process.args,
+                        timeout,
+                        output=self._capture_text(stdout),
+                        stderr=self._capture_text(stderr),
+                    ) from None
+        
+        return self._capture_text(stdout), self._capture_text(stderr)
     
     @staticmethod
-    def terminate_process(process: subprocess.Popen | None) -> None:
+    def terminate_process(process: subprocess.Popen | None, group: bool = False) -> None:
         """Terminate a running process gracefully.
         
         Attempts graceful termination first, then forces kill if needed.
         
         Args:
             process: Process to terminate (None is safe to pass)
+            group: Signal the process group led by process, so children it
+                started are stopped too. Only meaningful on POSIX for a
+                process started with start_new_session=True.
             
         """
         if not process:
             return
         
+        if group and os.name != 'nt':
+            def send(sig: int) -> None:
+                # The group outlives its leader while descendants remain,
+                # and its id cannot be reused until they are gone.
+                try:
+                    os.killpg(process.pid, sig)
+                except ProcessLookupError:
+                    pass
+            
+            def terminate() -> None:
+                send(signal.SIGTERM)
+            
+            def kill() -> None:
+                send(signal.SIGKILL)
+        else:
+            terminate = process.terminate
+            kill = process.kill
+        
         try:
             # Try graceful termination first
-            process.terminate()
+            terminate()
             try:
                 process.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 # Force kill if termination takes too long
                 log.warning("Process did not terminate gracefully, forcing kill...")
-                process.kill()
+                kill()
                 process.wait()
         except Exception as e:
-            log.error(f"Error terminating process: {e}")
+            log.error("Error terminating process: %s", e)
@@ -6,7 +6,7 @@ from typing import Callable
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Container for execution results."""
     return_code: int
@@ -27,7 +27,7 @@ class ExecutionResult:
         return f"ExecutionResult({status}, time={self.execution_time:.2f}s, pid={self.pid})"
 
 
-@dataclass
+@dataclass(slots=True)
 class WrapperConfig:
     """Configuration for application wrapper."""
     # Core settings
@@ -38,18 +38,22 @@ class WrapperConfig:
     env: dict[str, str] | None = None
     env_files: str | Path | list[str | Path] | None = None  # JSON file(s) with environment variables
     inherit_env: bool = False
-    env_allowlist: set[str] | None = None  # System vars to inherit in closed mode
+    env_allowlist: set[str] | frozenset[str] | None = None  # System vars to inherit in closed mode
     
     # Working directory
     cwd: str | Path | None = None
     
     # Output handling
     capture_output: bool = False
-    stream_output: bool = True
+    stream_output: bool = True  # Echo output; inherited directly unless captured or using callbacks
+    max_captured_bytes: int | None = None  # Keep only the last N bytes of each captured stream
     
     # Execution control
     timeout: float | None = None
     shell: bool = False
+    install_signal_handler: bool = True  # Intercept SIGINT while the child runs (main thread only); restored afterwards
+    new_process_group: bool = False  # POSIX: own session, so termination also stops the child's descendants
+    fast_spawn: bool = False  # POSIX: keep inheritable fds open (close_fds=False) so posix_spawn can be used
     
     # Callbacks
     pre_run: Callable[[], None] | None = None
@@ -57,6 +61,8 @@ class WrapperConfig:
     on_start: Callable[[int], None] | None = None  # Receives PID
     on_output: Callable[[str], None] | None = None  # Receives output line
     on_error: Callable[[str], None] | None = None  # Receives error line
+    on_output_batch: Callable[[list[str]], None] | None = None  # Receives the output lines of each read
+    on_error_batch: Callable[[list[str]], None] | None = None  # Receives the error lines of each read
     
     # Error handling
     raise_on_error: bool = True
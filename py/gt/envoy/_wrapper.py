@@ -1,9 +1,12 @@
 """Core application wrapper implementation."""
 
+import os
 import subprocess
 import logging
 import signal
+import threading
 import time
+import weakref
 from pathlib import Path
 from typing import Callable
 from contextlib import contextmanager
@@ -16,10 +19,49 @@ from ._executor import ProcessExecutor
 
 log = logging.getLogger(__name__)
 
+# Shared by every wrapper that attaches the module's console handler.
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Wrappers currently running with SIGINT handling. A single process-wide
+# handler dispatches to them: it is installed when the first of them starts
+# and the host's handler is restored once the last one finishes, so nested
+# runs (from pre_run or output callbacks) share it.
+_ACTIVE_WRAPPERS: 'weakref.WeakSet[ApplicationWrapper]' = weakref.WeakSet()
+
+# The SIGINT handler _dispatch_sigint replaced, used while no wrapper runs.
+_previous_sigint_handler = None
+
+
+def _dispatch_sigint(signum, frame):
+    """SIGINT handler shared by all wrappers.
+    
+    Forwards the signal to every running wrapper, or to the handler that was
+    in place before envoy installed this one when none is running.
+    
+    """
+    if _ACTIVE_WRAPPERS:
+        for wrapper in list(_ACTIVE_WRAPPERS):
+            wrapper._handle_signal(signum, frame)
+        return
+    
+    previous = _previous_sigint_handler
+    if callable(previous):
+        previous(signum, frame)
+    elif previous != signal.SIG_IGN:
+        # Default disposition: reinstate it and deliver the signal again
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        os.kill(os.getpid(), signal.SIGINT)
+
 
 class ApplicationWrapper:
     """Sophisticated application wrapper with pre/post operations and process control.
     
+    A wrapper can be run any number of times. Per-run state is reset by
+    run(). An executable found on PATH is resolved once and memoized, as is
+    the last env file merge while its inputs are unchanged, so loops should
+    reuse one wrapper rather than create a new one for every run. os.environ
+    is re-read on every run.
+    
     Example:
         >>> config = WrapperConfig(
         ...     executable="python",
@@ -43,7 +85,6 @@ class ApplicationWrapper:
         self.config = config
         self._process: subprocess.Popen | None = None
         self._interrupted = False
-        self._original_sigint_handler = None
         
         # Initialize managers
         self._env_manager = EnvironmentManager(
@@ -53,7 +94,12 @@ class ApplicationWrapper:
         self._executor = ProcessExecutor(
             stream_output=config.stream_output,
             on_output=config.on_output,
-            on_error=config.on_error
+            on_error=config.on_error,
+            capture_output=config.capture_output,
+            max_captured_bytes=config.max_captured_bytes,
+            on_output_batch=config.on_output_batch,
+            on_error_batch=config.on_error_batch,
+            new_process_group=config.new_process_group,
         )
         
         # Setup logging
@@ -66,32 +112,61 @@ class ApplicationWrapper:
         """
         if not log.handlers:
             handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(_LOG_FORMATTER)
             log.addHandler(handler)
         log.setLevel(self.config.log_level)
     
     def _handle_signal(self, signum, frame):
         """Handle interrupt signals.
         
+        Only records the interrupt. The wait loop notices the flag and
+        terminates the process outside the handler, so repeated signals
+        cannot start overlapping terminations.
+        
         """
-        log.warning(f"Received signal {signum}, terminating process...")
         self._interrupted = True
-        if self._process:
-            self._executor.terminate_process(self._process)
+    
+    def _is_interrupted(self) -> bool:
+        """Return True once an interrupt signal has been received.
+        
+        """
+        return self._interrupted
     
     @contextmanager
     def _signal_handler_context(self):
         """Context manager for signal handling.
         
+        Yields True if the SIGINT handler was installed.
+        
         """
-        self._original_sigint_handler = signal.signal(signal.SIGINT, self._handle_signal)
+        # Signal handlers can only be installed from the main thread. Runs on
+        # worker threads (run_async, thread pools) leave SIGINT to the caller,
+        # as do hosts that opt out to keep their own handler in place.
+        if (
+            not self.config.install_signal_handler
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            yield False
+            return
+        
+        global _previous_sigint_handler
+        if signal.getsignal(signal.SIGINT) is not _dispatch_sigint:
+            _previous_sigint_handler = signal.signal(signal.SIGINT, _dispatch_sigint)
+        
+        _ACTIVE_WRAPPERS.add(self)
         try:
-            yield
+            yield True
         finally:
-            signal.signal(signal.SIGINT, self._original_sigint_handler)
+            _ACTIVE_WRAPPERS.discard(self)
+            if not _ACTIVE_WRAPPERS and signal.getsignal(signal.SIGINT) is _dispatch_sigint:
+                # Hand SIGINT back to the host. None means the previous
+                # handler was not installed from Python; use the default.
+                previous = _previous_sigint_handler
+                signal.signal(
+                    signal.SIGINT,
+                    previous if previous is not None else signal.SIG_DFL
+                )
+                _previous_sigint_handler = None
     
     def _execute_pre_run(self):
         """Execute pre-run operations.
@@ -105,7 +180,7 @@ class ApplicationWrapper:
             self.config.pre_run()
             log.info("Pre-run operations completed")
         except Exception as e:
-            log.error(f"Pre-run operation failed: {e}")
+            log.error("Pre-run operation failed: %s", e)
             if not self.config.continue_on_pre_run_error:
                 raise PreRunError(f"Pre-run operation failed: {e}") from e
     
@@ -121,7 +196,7 @@ class ApplicationWrapper:
             self.config.post_run(result)
             log.info("Post-run operations completed")
         except Exception as e:
-            log.error(f"Post-run operation failed: {e}")
+            log.error("Post-run operation failed: %s", e)
             if not self.config.continue_on_post_run_error:
                 raise PostRunError(f"Post-run operation failed: {e}") from e
     
@@ -135,7 +210,8 @@ class ApplicationWrapper:
             WrapperError: On execution failures (if raise_on_error=True)
             
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        self._interrupted = False
         result = ExecutionResult(
             return_code=-1,
             command=[]
@@ -148,22 +224,32 @@ class ApplicationWrapper:
             # Build the subprocess environment first so that executable
             # resolution uses the subprocess PATH rather than the envoy
             # process PATH (critical in closed-environment mode).
-            env = self._env_manager.prepare_environment(
-                env_files=self.config.env_files,
-                env=self.config.env
-            )
+            if self.config.inherit_env and not self.config.env_files and not self.config.env:
+                # Nothing to layer on top of the system environment: let Popen
+                # inherit it natively instead of copying os.environ.
+                env = None
+                search_path = None
+            else:
+                env = self._env_manager.prepare_environment(
+                    env_files=self.config.env_files,
+                    env=self.config.env
+                )
+                search_path = env.get('PATH')
             command = self._executor.prepare_command(
                 self.config.executable,
                 self.config.args,
-                search_path=env.get('PATH'),
+                search_path=search_path,
             )
             cwd = str(self.config.cwd) if self.config.cwd else None
             
             result.command = command
             
-            log.info(f"Executing: {' '.join(command)}")
+            # Logging arguments are formatted lazily; the command join is the
+            # only eager work, so skip it when INFO is filtered out.
+            if log.isEnabledFor(logging.INFO):
+                log.info("Executing: %s", ' '.join(command))
             if cwd:
-                log.info(f"Working directory: {cwd}")
+                log.info("Working directory: %s", cwd)
             
             # Setup process arguments
             process_kwargs = {
@@ -172,12 +258,44 @@ class ApplicationWrapper:
                 'shell': self.config.shell,
             }
             
-            if self.config.capture_output or self.config.stream_output:
-                process_kwargs['stdout'] = subprocess.PIPE
-                process_kwargs['stderr'] = subprocess.PIPE
+            if os.name != 'nt':
+                if self.config.fast_spawn:
+                    # Skipping the close_fds sweep lets subprocess spawn via
+                    # posix_spawn instead of fork + exec when no cwd is
+                    # requested. Any descriptor marked inheritable is then
+                    # passed to the child, so this is opt-in.
+                    process_kwargs['close_fds'] = False
+                if self.config.new_process_group:
+                    # The child leads its own process group, so termination
+                    # can signal everything it starts. This takes it out of
+                    # the terminal's foreground group and rules out
+                    # posix_spawn, hence opt-in.
+                    process_kwargs['start_new_session'] = True
+            
+            # Pipes are only needed when envoy itself consumes the output.
+            # Plain streaming leaves stdout/stderr inherited so the child
+            # writes straight to the console without passing through Python.
+            pipe_stdout = bool(
+                self.config.capture_output or self.config.on_output or self.config.on_output_batch
+            )
+            pipe_stderr = bool(
+                self.config.capture_output or self.config.on_error or self.config.on_error_batch
+            )
+            needs_pipe = pipe_stdout or pipe_stderr
+            if needs_pipe:
+                # Only the streams envoy consumes are piped. The other one is
+                # inherited when streaming, or discarded at the source rather
+                # than drained from a pipe nobody reads.
+                unpiped = None if self.config.stream_output else subprocess.DEVNULL
+                process_kwargs['stdout'] = subprocess.PIPE if pipe_stdout else unpiped
+                process_kwargs['stderr'] = subprocess.PIPE if pipe_stderr else unpiped
+                # The executor reads the pipe fds in large blocks itself, so
+                # a Python-level read buffer on top would only add a copy.
+                process_kwargs['bufsize'] = 0
             
             # Execute with signal handling
-            with self._signal_handler_context():
+            with self._signal_handler_context() as handling_signals:
+                interrupted = self._is_interrupted if handling_signals else None
                 self._process = subprocess.Popen(command, **process_kwargs)
                 result.pid = self._process.pid
                 
@@ -186,46 +304,57 @@ class ApplicationWrapper:
                     try:
                         self.config.on_start(result.pid)
                     except Exception as e:
-                        log.warning(f"on_start callback error: {e}")
+                        log.warning("on_start callback error: %s", e)
                 
-                log.info(f"Process started with PID: {result.pid}")
+                log.info("Process started with PID: %s", result.pid)
                 
                 # Handle output
-                if self.config.capture_output or self.config.stream_output:
+                if needs_pipe:
                     try:
-                        stdout, stderr = self._executor.stream_process_output(self._process)
-                        result.stdout = stdout if stdout else None
-                        result.stderr = stderr if stderr else None
-                        return_code = self._process.wait(timeout=self.config.timeout)
-                    except subprocess.TimeoutExpired:
-                        log.error(f"Process timed out after {self.config.timeout}s")
-                        self._executor.terminate_process(self._process)
+                        stdout, stderr = self._executor.stream_process_output(
+                            self._process,
+                            timeout=self.config.timeout,
+                            interrupted=interrupted,
+                        )
+                        return_code = self._process.returncode
+                    except subprocess.TimeoutExpired as e:
+                        # The executor has already terminated the process.
+                        log.error("Process timed out after %ss", self.config.timeout)
+                        stdout, stderr = e.output, e.stderr
                         result.timed_out = True
                         return_code = -1
+                    result.stdout = stdout if stdout else None
+                    result.stderr = stderr if stderr else None
                 else:
                     try:
-                        return_code = self._process.wait(timeout=self.config.timeout)
+                        return_code = self._executor.wait_process(
+                            self._process,
+                            timeout=self.config.timeout,
+                            interrupted=interrupted,
+                        )
                     except subprocess.TimeoutExpired:
-                        log.error(f"Process timed out after {self.config.timeout}s")
-                        self._executor.terminate_process(self._process)
+                        log.error("Process timed out after %ss", self.config.timeout)
+                        self._executor.terminate_process(
+                            self._process, group=self.config.new_process_group
+                        )
                         result.timed_out = True
                         return_code = -1
                 
                 result.return_code = return_code
-                result.execution_time = time.time() - start_time
+                result.execution_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 if self._interrupted:
                     log.warning("Process was interrupted")
                     result.return_code = -2
                 
-                log.info(f"Process finished: {result}")
+                log.info("Process finished: %s", result)
                 
         except (PreRunError, PostRunError):
             # Re-raise wrapper errors
             raise
         except Exception as e:
-            result.execution_time = time.time() - start_time
-            log.error(f"Execution failed: {e}")
+            result.execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            log.error("Execution failed: %s", e)
             if self.config.raise_on_error:
                 raise ExecutionError(f"Execution failed: {e}") from e
         finally:
@@ -250,25 +379,82 @@ class ApplicationWrapper:
         
         return result
     
+    async def run_async(self) -> ExecutionResult:
+        """Execute the application without blocking the running event loop.
+        
+        The blocking run() is executed on a worker thread, so many wrappers
+        can be awaited concurrently (e.g. with asyncio.gather). SIGINT is not
+        intercepted for runs started this way.
+        
+        Returns:
+            ExecutionResult with execution details
+            
+        Raises:
+            WrapperError: On execution failures (if raise_on_error=True)
+            
+        """
+        # Imported here so that plain run() callers, the CLI in particular,
+        # don't pay for loading asyncio at startup.
+        import asyncio
+        
+        return await asyncio.to_thread(self.run)
+    
+    @classmethod
+    def run_many(
+        cls,
+        configs: list[WrapperConfig],
+        max_concurrency: int | None = None,
+    ) -> list[ExecutionResult]:
+        """Run several independent configurations concurrently.
+        
+        Each configuration gets its own wrapper, run on a shared thread
+        pool. The runs spend their time waiting on child processes, so the
+        total wall time approaches that of the slowest run rather than the
+        sum of all of them. SIGINT is not intercepted for these runs.
+        
+        Args:
+            configs: WrapperConfig for each run
+            max_concurrency: Maximum number of concurrent runs (defaults to
+                the number of CPUs)
+            
+        Returns:
+            ExecutionResult for each configuration, in the order given
+            
+        Raises:
+            WrapperError: Re-raised from the first failing run, in config
+                order, once every run has finished (raise_on_error=True)
+            
+        """
+        if not configs:
+            return []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        workers = min(max_concurrency or os.cpu_count() or 1, len(configs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(cls(config).run) for config in configs]
+        return [future.result() for future in futures]
+    
     def __call__(self) -> ExecutionResult:
         """Allow wrapper to be called as a function.
         
         """
         return self.run()
     
-    @contextmanager
-    def __enter__(self):
+    def __enter__(self) -> 'ApplicationWrapper':
         """Context manager entry.
         
         """
-        yield self
+        return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup if process is still running.
         
         """
         if self._process:
-            self._executor.terminate_process(self._process)
+            self._executor.terminate_process(
+                self._process, group=self.config.new_process_group
+            )
 
 
 def create_wrapper(
@@ -1,9 +1,15 @@
 """Example usage of the ApplicationWrapper module."""
 
+import atexit
+import functools
+import json
 import os
+import shutil
+import sys
+import tempfile
 import time
 from pathlib import Path
-from gt.app.wrapper import (
+from gt.envoy import (
     ApplicationWrapper,
     WrapperConfig,
     ExecutionResult,
@@ -11,11 +17,39 @@ from gt.app.wrapper import (
 )
 
 
+_BANNER = "=" * 60
+
+
+def _header(title: str):
+    """Print an example's banner."""
+    print(f"{_BANNER}\n{title}\n{_BANNER}")
+
+
+# Shared by every example that writes an env file
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _write_json(path: Path, payload: dict):
+    """Write an example env file."""
+    path.write_text(_JSON_ENCODER.encode(payload), encoding="utf-8")
+
+
+@functools.cache
+def _temp_dir() -> Path:
+    """Return a scratch directory shared by the examples.
+    
+    Created on first use and removed when the interpreter exits, so the
+    examples do not need to clean up the files they write.
+    
+    """
+    path = Path(tempfile.mkdtemp(prefix="envoy_examples_"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
 def example_basic():
     """Basic usage example."""
-    print("=" * 60)
-    print("BASIC EXAMPLE")
-    print("=" * 60)
+    _header("BASIC EXAMPLE")
     
     config = WrapperConfig(
         executable="python",
@@ -34,9 +68,7 @@ def example_basic():
 
 def example_with_environment():
     """Example with environment variables."""
-    print("=" * 60)
-    print("ENVIRONMENT VARIABLES EXAMPLE")
-    print("=" * 60)
+    _header("ENVIRONMENT VARIABLES EXAMPLE")
     
     def pre_run():
         print("Setting up environment...")
@@ -63,9 +95,7 @@ def example_with_environment():
 
 def example_with_timeout():
     """Example with timeout."""
-    print("=" * 60)
-    print("TIMEOUT EXAMPLE")
-    print("=" * 60)
+    _header("TIMEOUT EXAMPLE")
     
     config = WrapperConfig(
         executable="python",
@@ -84,9 +114,7 @@ def example_with_timeout():
 
 def example_with_callbacks():
     """Example with various callbacks."""
-    print("=" * 60)
-    print("CALLBACKS EXAMPLE")
-    print("=" * 60)
+    _header("CALLBACKS EXAMPLE")
     
     def on_start(pid: int):
         print(f"[CALLBACK] Process started with PID: {pid}")
@@ -114,9 +142,7 @@ def example_with_callbacks():
 
 def example_context_manager():
     """Example using context manager."""
-    print("=" * 60)
-    print("CONTEXT MANAGER EXAMPLE")
-    print("=" * 60)
+    _header("CONTEXT MANAGER EXAMPLE")
     
     config = WrapperConfig(
         executable="python",
@@ -134,9 +160,7 @@ def example_context_manager():
 
 def example_convenience_function():
     """Example using the convenience create_wrapper function."""
-    print("=" * 60)
-    print("CONVENIENCE FUNCTION EXAMPLE")
-    print("=" * 60)
+    _header("CONVENIENCE FUNCTION EXAMPLE")
     
     # Simple one-liner wrapper creation
     wrapper = create_wrapper(
@@ -154,9 +178,7 @@ def example_convenience_function():
 
 def example_error_handling():
     """Example with error handling."""
-    print("=" * 60)
-    print("ERROR HANDLING EXAMPLE")
-    print("=" * 60)
+    _header("ERROR HANDLING EXAMPLE")
     
     def pre_run():
         print("Pre-run check...")
@@ -189,12 +211,9 @@ def example_error_handling():
 
 def example_working_directory():
     """Example with custom working directory."""
-    print("=" * 60)
-    print("WORKING DIRECTORY EXAMPLE")
-    print("=" * 60)
+    _header("WORKING DIRECTORY EXAMPLE")
     
-    temp_dir = Path(__file__).parent.parent / "test_bundle" / "temp"
-    temp_dir.mkdir(exist_ok=True)
+    temp_dir = _temp_dir()
     
     config = WrapperConfig(
         executable="python",
@@ -213,15 +232,10 @@ def example_working_directory():
 
 def example_env_from_files():
     """Example loading environment variables from JSON files."""
-    print("=" * 60)
-    print("ENVIRONMENT FROM FILES EXAMPLE")
-    print("=" * 60)
-    
-    import json
+    _header("ENVIRONMENT FROM FILES EXAMPLE")
     
     # Create temporary environment files
-    temp_dir = Path(__file__).parent.parent / "test_bundle" / "temp"
-    temp_dir.mkdir(exist_ok=True)
+    temp_dir = _temp_dir()
     
     # Base environment
     base_env = {
@@ -230,8 +244,7 @@ def example_env_from_files():
         "DEBUG": "false"
     }
     base_env_file = temp_dir / "base_env.json"
-    with open(base_env_file, 'w') as f:
-        json.dump(base_env, f, indent=2)
+    _write_json(base_env_file, base_env)
     
     # Override environment
     override_env = {
@@ -239,8 +252,7 @@ def example_env_from_files():
         "LOG_LEVEL": "verbose"
     }
     override_env_file = temp_dir / "override_env.json"
-    with open(override_env_file, 'w') as f:
-        json.dump(override_env, f, indent=2)
+    _write_json(override_env_file, override_env)
     
     # Use multiple JSON files (later files override earlier ones)
     config = WrapperConfig(
@@ -265,24 +277,15 @@ print(f"CUSTOM: {os.environ.get('CUSTOM')}")
     
     print("Environment priority: system < file1 < file2 < env dict")
     print(f"Output:\n{result.stdout}")
-    
-    # Cleanup
-    base_env_file.unlink()
-    override_env_file.unlink()
     print()
 
 
 def example_list_paths():
     """Example using list-based paths with Unix format."""
-    print("=" * 60)
-    print("LIST-BASED PATHS EXAMPLE")
-    print("=" * 60)
-    
-    import json
+    _header("LIST-BASED PATHS EXAMPLE")
     
     # Create temporary environment file
-    temp_dir = Path(__file__).parent.parent / "test_bundle" / "temp"
-    temp_dir.mkdir(exist_ok=True)
+    temp_dir = _temp_dir()
     
     # Define paths as lists using Unix format (/)
     env_with_lists = {
@@ -304,8 +307,7 @@ def example_list_paths():
     }
     
     env_file = temp_dir / "list_paths.json"
-    with open(env_file, 'w') as f:
-        json.dump(env_with_lists, f, indent=2)
+    _write_json(env_file, env_with_lists)
     
     # Set up existing environment for append demo
     os.environ["CUSTOM_PATH"] = "C:/original/custom"
@@ -314,26 +316,26 @@ def example_list_paths():
         executable="python",
         args=["-c", """
 import os
-import sys
 print("PYTHONPATH:")
 pythonpath = os.environ.get('PYTHONPATH', '')
-for p in pythonpath.split(';' if sys.platform == 'win32' else ':'):
-    if p:
-        print(f"  - {p}")
+for p in filter(None, pythonpath.split(os.pathsep)):
+    print(f"  - {p}")
 
 print()
 print("PATH (first 3):")
-path = os.environ.get('PATH', '')
-for i, p in enumerate(path.split(';' if sys.platform == 'win32' else ':')):
-    if i < 3 and p:
+rest = os.environ.get('PATH', '')
+for i in range(3):
+    p, sep, rest = rest.partition(os.pathsep)
+    if p:
         print(f"  - {p}")
+    if not sep:
+        break
 
 print()
 print("CUSTOM_PATH:")
 custom = os.environ.get('CUSTOM_PATH', '')
-for p in custom.split(';' if sys.platform == 'win32' else ':'):
-    if p:
-        print(f"  - {p}")
+for p in filter(None, custom.split(os.pathsep)):
+    print(f"  - {p}")
 """],
         env_files=env_file,
         capture_output=True,
@@ -350,23 +352,15 @@ for p in custom.split(';' if sys.platform == 'win32' else ':'):
     print("  ✓ Automatically joined with OS separator")
     print()
     print(f"Output:\n{result.stdout}")
-    
-    # Cleanup
-    env_file.unlink()
     print()
 
 
 def example_env_append_prepend():
     """Example demonstrating append/prepend to environment variables."""
-    print("=" * 60)
-    print("ENVIRONMENT APPEND/PREPEND EXAMPLE")
-    print("=" * 60)
-    
-    import json
+    _header("ENVIRONMENT APPEND/PREPEND EXAMPLE")
     
     # Create temporary environment files
-    temp_dir = Path(__file__).parent.parent / "test_bundle" / "temp"
-    temp_dir.mkdir(exist_ok=True)
+    temp_dir = _temp_dir()
     
     # Set a base PYTHONPATH for demonstration
     os.environ["MY_CUSTOM_PATH"] = "C:\\original\\path"
@@ -378,8 +372,7 @@ def example_env_append_prepend():
         "NEW_VAR": "Initial value"
     }
     append_file = temp_dir / "append_env.json"
-    with open(append_file, 'w') as f:
-        json.dump(append_env, f, indent=2)
+    _write_json(append_file, append_env)
     
     # Prepend to variable (and chain multiple files)
     prepend_env = {
@@ -387,8 +380,7 @@ def example_env_append_prepend():
         "NEW_VAR": "{$NEW_VAR} + more"
     }
     prepend_file = temp_dir / "prepend_env.json"
-    with open(prepend_file, 'w') as f:
-        json.dump(prepend_env, f, indent=2)
+    _write_json(prepend_file, prepend_env)
     
     config = WrapperConfig(
         executable="python",
@@ -418,16 +410,14 @@ print(f"NEW_VAR: {os.environ.get('NEW_VAR')}")
         "+=MY_CUSTOM_PATH": "C:\\appended\\with\\operator"
     }
     append_op_file = temp_dir / "append_op_env.json"
-    with open(append_op_file, 'w') as f:
-        json.dump(append_op_env, f, indent=2)
+    _write_json(append_op_file, append_op_env)
     
     # Prepend operator
     prepend_op_env = {
         "^=MY_CUSTOM_PATH": "C:\\prepended\\with\\operator"
     }
     prepend_op_file = temp_dir / "prepend_op_env.json"
-    with open(prepend_op_file, 'w') as f:
-        json.dump(prepend_op_env, f, indent=2)
+    _write_json(prepend_op_file, prepend_op_env)
     
     config2 = WrapperConfig(
         executable="python",
@@ -446,30 +436,19 @@ print(f"NEW_VAR: {os.environ.get('NEW_VAR')}")
     print("  +=VAR  : Appends value to existing variable")
     print("  ^=VAR  : Prepends value to existing variable")
     print("  VAR    : Replaces value (supports {$VAR} expansion)")
-    
-    # Cleanup
-    append_file.unlink()
-    prepend_file.unlink()
-    append_op_file.unlink()
-    prepend_op_file.unlink()
     print()
 
 def example_special_variables():
     """Example using special wrapper variables like {$__BUNDLE__}."""
-    print("=" * 60)
-    print("SPECIAL WRAPPER VARIABLES EXAMPLE")
-    print("=" * 60)
-    
-    import json
+    _header("SPECIAL WRAPPER VARIABLES EXAMPLE")
     
     # Create a bundle structure with envoy_env directory
-    temp_dir = Path(__file__).parent.parent / "test_bundle" / "temp"
-    temp_dir.mkdir(exist_ok=True)
+    temp_dir = _temp_dir()
     
     # Create bundle directory structure
     bundle_dir = temp_dir / "my_bundle"
     bundle_dir.mkdir(exist_ok=True)
-wrapper_env_dir = bundle_dir / "envoy_env"
+    wrapper_env_dir = bundle_dir / "envoy_env"
     wrapper_env_dir.mkdir(exist_ok=True)
     
     # Create environment file using special variables
@@ -486,14 +465,12 @@ wrapper_env_dir = bundle_dir / "envoy_env"
     }
     
     env_file = wrapper_env_dir / "config.json"
-    with open(env_file, 'w') as f:
-        json.dump(env_config, f, indent=2)
+    _write_json(env_file, env_config)
     
     config = WrapperConfig(
         executable="python",
         args=["-c", """
 import os
-import sys
 print("Special wrapper variables resolved:")
 print()
 print(f"APP_ROOT: {os.environ.get('APP_ROOT')}")
@@ -502,8 +479,8 @@ print(f"CONFIG_FILE: {os.environ.get('CONFIG_FILE')}")
 print()
 print("PYTHONPATH additions:")
 pythonpath = os.environ.get('PYTHONPATH', '')
-for p in pythonpath.split(';' if sys.platform == 'win32' else ':'):
-    if 'my_bundle' in p and p:
+for p in pythonpath.split(os.pathsep):
+    if 'my_bundle' in p:
         print(f"  - {p}")
 print()
 print(f"ENV_FILE_PATH: {os.environ.get('ENV_FILE_PATH')}")
@@ -530,17 +507,11 @@ print(f"ENV_FILE_PATH: {os.environ.get('ENV_FILE_PATH')}")
     print("  ✓ No hard-coded paths")
     print("  ✓ Works with version control")
     print()
-    
-    # Cleanup
-    import shutil
-    shutil.rmtree(bundle_dir)
     print()
 
 def example_real_world_scenario():
     """Real-world scenario: Running a build process."""
-    print("=" * 60)
-    print("REAL-WORLD SCENARIO: Build Process")
-    print("=" * 60)
+    _header("REAL-WORLD SCENARIO: Build Process")
     
     build_start_time = None
     
@@ -602,28 +573,58 @@ print('Build complete!')
     print()
 
 
-if __name__ == "__main__":
-    # Run all examples
-    examples = [
-        example_basic,
-        example_with_environment,
-        example_with_callbacks,
-        example_context_manager,
-        example_convenience_function,
-        example_working_directory,
-        example_env_from_files,
-        example_list_paths,
-        example_env_append_prepend,
-        example_special_variables,
-        example_error_handling,
-        example_with_timeout,
-        example_real_world_scenario
-    ]
-    
-    for example in examples:
+# Examples by name, in the order they run by default
+EXAMPLES = {
+    'basic': example_basic,
+    'environment': example_with_environment,
+    'callbacks': example_with_callbacks,
+    'context_manager': example_context_manager,
+    'convenience_function': example_convenience_function,
+    'working_directory': example_working_directory,
+    'env_from_files': example_env_from_files,
+    'list_paths': example_list_paths,
+    'env_append_prepend': example_env_append_prepend,
+    'special_variables': example_special_variables,
+    'error_handling': example_error_handling,
+    'timeout': example_with_timeout,
+    'real_world_scenario': example_real_world_scenario,
+}
+
+
+def run_examples(names: list[str]):
+    """Run the named examples in order."""
+    for name in names:
+        example = EXAMPLES.get(name)
+        if example is None:
+            print(f"Unknown example: {name} (choose from: {', '.join(EXAMPLES)})\n")
+            continue
         try:
             example()
         except Exception as e:
             print(f"Example failed: {e}\n")
+
+
+if __name__ == "__main__":
+    # Run the examples named on the command line, or all of them
+    names = sys.argv[1:] or list(EXAMPLES)
+    
+    # ENVOY_PROFILE=1 profiles the run and prints the top entries;
+    # ENVOY_PROFILE=<file> also saves the raw stats there for later diffing.
+    profile_target = os.environ.get('ENVOY_PROFILE')
+    if profile_target:
+        import cProfile
+        import pstats
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            run_examples(names)
+        finally:
+            profiler.disable()
+            if profile_target != '1':
+                profiler.dump_stats(profile_target)
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(30)
+    else:
+        run_examples(names)
     
     print("All examples completed!")
@@ -0,0 +1,147 @@
+"""Tests for the envoy command line interface."""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add the module to path for testing
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from gt.envoy import _cli
+from gt.envoy._commands import CommandRegistry
+
+
+class _ExecCalled(Exception):
+    """Raised by the os.execve stand-in so the exec path stops there."""
+
+
+def _write_json(path: Path, data: dict) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def _make_commands(root: Path) -> Path:
+    """Create an envoy_env with one 'hello' command and return commands.json."""
+    env_dir = root / "envoy_env"
+    env_dir.mkdir()
+    _write_json(env_dir / "tool.json", {"ENVOY_TEST_VALUE": "from-env-file"})
+    commands_file = env_dir / "commands.json"
+    _write_json(commands_file, {
+        "hello": {"environment": ["tool.json"], "alias": ["sh", "-c", "exit 0"]},
+    })
+    return commands_file
+
+
+def _fake_execve(calls: list):
+    """Return an os.execve stand-in recording its arguments into calls."""
+    def execve(path, argv, env):
+        calls.append((path, argv, env))
+        raise _ExecCalled()
+    return execve
+
+
+def test_run_command_returns_by_default():
+    """Test that run_command runs the command as a child and returns its code."""
+    print("Testing run_command without exec...")
+    
+    if os.name == 'nt':
+        print("  ⏭️  Skipped (POSIX only)")
+        return
+    
+    calls = []
+    real_execve = os.execve
+    os.execve = _fake_execve(calls)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            registry = CommandRegistry(_make_commands(Path(tmpdir)))
+            assert _cli.run_command(registry, "hello", []) == 0, \
+                "run_command should return the command's exit code"
+    finally:
+        os.execve = real_execve
+    
+    assert not calls, "run_command must not replace the process by default"
+    
+    print("  ✅ run_command without exec test passed")
+
+
+def test_run_command_exec():
+    """Test that exec_=True hands the resolved command and env to os.execve."""
+    print("Testing run_command with exec...")
+    
+    if os.name == 'nt':
+        print("  ⏭️  Skipped (POSIX only)")
+        return
+    
+    calls = []
+    real_execve = os.execve
+    os.execve = _fake_execve(calls)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            registry = CommandRegistry(_make_commands(Path(tmpdir)))
+            try:
+                _cli.run_command(registry, "hello", ["extra"], exec_=True)
+            except _ExecCalled:
+                pass
+    finally:
+        os.execve = real_execve
+    
+    assert len(calls) == 1, f"Expected one execve call, got {len(calls)}"
+    path, argv, env = calls[0]
+    sh = shutil.which("sh", path=env.get("PATH"))
+    assert path == sh, f"Unexpected executable: {path}"
+    assert argv == [sh, "-c", "exit 0", "extra"], f"Unexpected argv: {argv}"
+    assert env["ENVOY_TEST_VALUE"] == "from-env-file", "Env file not applied"
+    
+    print("  ✅ run_command with exec test passed")
+
+
+def test_main_empty_command():
+    """Test that an empty command name prints help instead of failing."""
+    print("Testing main with an empty command...")
+    
+    cwd = os.getcwd()
+    roots = os.environ.pop('ENVOY_BNDL_ROOTS', None)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _make_commands(Path(tmpdir))
+            os.chdir(tmpdir)
+            assert _cli.main(['']) == 0, "Empty command should print help and succeed"
+    finally:
+        os.chdir(cwd)
+        if roots is not None:
+            os.environ['ENVOY_BNDL_ROOTS'] = roots
+    
+    print("  ✅ Empty command test passed")
+
+
+def test_clear_commands_file_cache():
+    """Test that clear_commands_file_cache picks up a closer envoy_env."""
+    print("Testing clear_commands_file_cache...")
+    
+    from gt.envoy import clear_commands_file_cache, find_commands_file
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        outer = _make_commands(Path(tmpdir))
+        inner_dir = Path(tmpdir) / "project"
+        inner_dir.mkdir()
+        assert find_commands_file(inner_dir) == outer.resolve()
+        
+        inner = _make_commands(inner_dir)
+        assert find_commands_file(inner_dir) == outer.resolve(), \
+            "Lookup should be served from the cache"
+        
+        clear_commands_file_cache()
+        assert find_commands_file(inner_dir) == inner.resolve(), \
+            "Cleared cache should find the closer commands.json"
+    
+    print("  ✅ clear_commands_file_cache test passed")
+
+
+if __name__ == "__main__":
+    test_run_command_returns_by_default()
+    test_run_command_exec()
+    test_main_empty_command()
+    test_clear_commands_file_cache()
@@ -1,10 +1,16 @@
 """Test bundle discovery functionality."""
 
+import sys
 from pathlib import Path
+
+# Add the module to path for testing
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
 from gt.envoy._discovery import (
     validate_bundle,
     load_bundles_from_config,
-    get_bundles
+    get_bundles,
+    discover_bundles_from_roots
 )
 
 def test_validation():
@@ -54,7 +60,127 @@ def test_auto_discovery():
         print(f"  Error: {e}")
     print()
 
+def test_discovery_index():
+    """Test that auto-discovery reuses and invalidates its on-disk index."""
+    import os
+    import tempfile
+    import time
+    from unittest import mock
+    import gt.envoy._discovery as discovery
+    print("Testing auto-discovery index...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir) / "roots"
+        (root / "pkg_a" / ".git").mkdir(parents=True)
+        (root / "pkg_a" / "envoy_env").mkdir()
+        (root / "group").mkdir()
+        
+        # Age the walked directories past the racy-mtime window
+        old = time.time() - 60
+        for path in (root, root / "group"):
+            os.utime(path, (old, old))
+        
+        cache_env = {'XDG_CACHE_HOME': temp_dir, 'LOCALAPPDATA': temp_dir}
+        with mock.patch.dict(os.environ, cache_env):
+            first = discover_bundles_from_roots([str(root)])
+            assert [b.name for b in first] == ["pkg_a"]
+            
+            with mock.patch.object(discovery, 'find_git_repos') as walk:
+                cached = discover_bundles_from_roots([str(root)])
+            assert not walk.called, "Unchanged root should not be walked"
+            assert [b.name for b in cached] == ["pkg_a"]
+            
+            # A new repo in a nested directory changes its mtime
+            (root / "group" / "pkg_b" / ".git").mkdir(parents=True)
+            (root / "group" / "pkg_b" / "envoy_env").mkdir()
+            refreshed = discover_bundles_from_roots([str(root)])
+            assert sorted(b.name for b in refreshed) == ["pkg_a", "pkg_b"]
+    
+    print("  ✅ Discovery index reused and invalidated")
+    print()
+
+def _make_bundle(path: Path) -> None:
+    """Create a git repo with an envoy_env/ directory at path."""
+    (path / ".git").mkdir(parents=True)
+    (path / "envoy_env").mkdir()
+
+def test_discovery_ignore():
+    """Test that ignored directories are skipped and the env var extends them."""
+    import os
+    import tempfile
+    from unittest import mock
+    import gt.envoy._discovery as discovery
+    print("Testing discovery ignore list...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir) / "roots"
+        _make_bundle(root / "pkg_a")
+        _make_bundle(root / "node_modules" / "pkg_npm")
+        _make_bundle(root / "vendor" / "pkg_vendor")
+        
+        scanned = {}
+        repos = discovery.find_git_repos(root, scanned=scanned)
+        assert sorted(p.name for p in repos) == ["pkg_a", "pkg_vendor"]
+        assert not any("node_modules" in key for key in scanned), \
+            "Default-ignored directories should not be scanned"
+        
+        env = {
+            'XDG_CACHE_HOME': temp_dir,
+            'LOCALAPPDATA': temp_dir,
+            'ENVOY_DISCOVERY_IGNORE': "vendor; extra:more",
+        }
+        with mock.patch.dict(os.environ, env):
+            ignore = discovery._discovery_ignore()
+            assert ignore == discovery._DEFAULT_IGNORE | {"vendor", "extra", "more"}, \
+                f"Env var should extend the default set: {sorted(ignore)}"
+            bundles = discover_bundles_from_roots([str(root)])
+        assert [b.name for b in bundles] == ["pkg_a"], \
+            f"Extra ignored names should be skipped: {[b.name for b in bundles]}"
+    
+    print("  ✅ Ignored directories skipped")
+    print()
+
+def test_discovery_threads():
+    """Test that concurrent discovery keeps the single-threaded order."""
+    import os
+    import tempfile
+    import time
+    from unittest import mock
+    import gt.envoy._discovery as discovery
+    print("Testing concurrent discovery order...")
+    
+    # Later items finish first, so the results must be put back in order
+    def slow_identity(item):
+        time.sleep(0.01 * (5 - item))
+        return item
+    
+    with mock.patch.dict(os.environ, {'ENVOY_DISCOVERY_THREADS': '4'}):
+        assert discovery._map_io(slow_identity, list(range(5))) == list(range(5))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        roots = []
+        for r in range(4):
+            root = Path(temp_dir) / f"root{r}"
+            for b in ("zeta", "alpha", "mid"):
+                _make_bundle(root / f"{b}_{r}")
+            roots.append(str(root))
+        
+        results = {}
+        for threads in ("1", "8"):
+            env = {'ENVOY_DISCOVERY_THREADS': threads, 'ENVOY_BUNDLE_CACHE': '0'}
+            with mock.patch.dict(os.environ, env):
+                results[threads] = [b.root for b in discover_bundles_from_roots(roots)]
+        
+        assert len(results["1"]) == 12, f"Expected 12 bundles, got {len(results['1'])}"
+        assert results["8"] == results["1"], "Thread count should not change the order"
+    
+    print("  ✅ Concurrent discovery order matches")
+    print()
+
 if __name__ == '__main__':
     test_validation()
     test_config_loading()
     test_auto_discovery()
+    test_discovery_index()
+    test_discovery_ignore()
+    test_discovery_threads()
@@ -0,0 +1,149 @@
+"""Tests for EnvironmentManager env file loading."""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add the module to path for testing
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from gt.envoy._environment import EnvironmentManager
+
+
+def _write_json(path: Path, data: dict) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_env_file_reloaded_after_edit():
+    """Test that cached env files are re-read once they change on disk."""
+    print("Testing env file cache invalidation...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env_file = Path(tmpdir) / "env.json"
+        manager = EnvironmentManager()
+        
+        _write_json(env_file, {"VALUE": "first"})
+        assert manager.load_env_from_files(env_file)["VALUE"] == "first"
+        
+        _write_json(env_file, {"VALUE": "second-edit"})
+        assert manager.load_env_from_files(env_file)["VALUE"] == "second-edit", \
+            "Edited env file should be re-parsed"
+    
+    print("  ✅ Env file cache invalidation test passed")
+
+
+def test_special_variables():
+    """Test special variable resolution for a bundle env file."""
+    print("Testing special variables...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env_dir = Path(tmpdir) / "my_bundle" / "envoy_env"
+        env_dir.mkdir(parents=True)
+        env_file = env_dir / "tool.json"
+        _write_json(env_file, {
+            "ROOT": "{$__BUNDLE__}",
+            "NAME": "{$__BUNDLE_NAME__}",
+            "LITERAL": "no references here",
+        })
+        
+        env = EnvironmentManager().load_env_from_files(env_file)
+        
+        bundle_root = str(env_dir.parent.resolve()).replace('\\', '/')
+        assert env["ROOT"] == bundle_root, f"Unexpected bundle root: {env['ROOT']}"
+        assert env["NAME"] == "my_bundle", f"Unexpected bundle name: {env['NAME']}"
+        assert env["LITERAL"] == "no references here"
+    
+    print("  ✅ Special variables test passed")
+
+
+def test_expand_plain_special_vars():
+    """Test that expand_env_value resolves plain names from special_vars."""
+    print("Testing plain-name special variables...")
+    
+    expand = EnvironmentManager.expand_env_value
+    current_env = {"ROOT": "from-env", "OTHER": "other"}
+    special_vars = {"ROOT": "from-special", "__FILE__": "env.json"}
+    
+    assert expand("{$ROOT}/bin", current_env, special_vars) == "from-special/bin", \
+        "special_vars should take priority for plain names"
+    assert expand("{$OTHER};{$__FILE__}", current_env, special_vars) == "other;env.json"
+    assert expand("{$ROOT}", current_env) == "from-env", "current_env is the fallback"
+    assert expand("{$MISSING}", current_env, special_vars) == "", \
+        "Unresolved references expand to an empty string"
+    
+    print("  ✅ Plain-name special variables test passed")
+
+
+def test_env_merge_cache_invalidation():
+    """Test that the last env file merge is redone when its inputs change."""
+    print("Testing env merge cache invalidation...")
+    
+    name = "ENVOY_TEST_MERGE_BASE"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env_file = Path(tmpdir) / "env.json"
+        manager = EnvironmentManager(inherit_env=True)
+        
+        def value() -> str:
+            return manager.prepare_environment(env_files=env_file)["VALUE"]
+        
+        try:
+            os.environ[name] = "base1"
+            _write_json(env_file, {"VALUE": "a-{$" + name + "}"})
+            first = manager.prepare_environment(env_files=env_file)
+            first["VALUE"] = "modified by caller"
+            assert value() == "a-base1", "Cached merge should be returned as a copy"
+            
+            # Same size, new mtime
+            stat = env_file.stat()
+            _write_json(env_file, {"VALUE": "b-{$" + name + "}"})
+            os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert value() == "b-base1", "An mtime change should invalidate the merge"
+            
+            # New size, mtime restored
+            stat = env_file.stat()
+            _write_json(env_file, {"VALUE": "longer-{$" + name + "}"})
+            os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert value() == "longer-base1", "A size change should invalidate the merge"
+            
+            os.environ[name] = "base2"
+            assert value() == "longer-base2", "A base_env change should invalidate the merge"
+        finally:
+            os.environ.pop(name, None)
+    
+    print("  ✅ Env merge cache invalidation test passed")
+
+
+def test_clear_env_file_cache():
+    """Test that clear_env_file_cache empties the module caches."""
+    print("Testing clear_env_file_cache...")
+    
+    from gt.envoy import clear_env_file_cache
+    from gt.envoy import _environment
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env_dir = Path(tmpdir) / "bundle" / "envoy_env"
+        env_dir.mkdir(parents=True)
+        env_file = env_dir / "env.json"
+        _write_json(env_file, {"ROOT": "{$__BUNDLE__}"})
+        
+        EnvironmentManager().load_env_from_files(env_file)
+        assert _environment._ENV_FILE_CACHE and _environment._SPECIAL_VARS_CACHE
+        
+        clear_env_file_cache()
+        assert not _environment._ENV_FILE_CACHE, "Parsed env files should be dropped"
+        assert not _environment._SPECIAL_VARS_CACHE, "Special variables should be dropped"
+        assert EnvironmentManager().load_env_from_files(env_file)["ROOT"], \
+            "Files should load again after a clear"
+    
+    print("  ✅ clear_env_file_cache test passed")
+
+
+if __name__ == "__main__":
+    test_env_file_reloaded_after_edit()
+    test_special_variables()
+    test_expand_plain_special_vars()
+    test_env_merge_cache_invalidation()
+    test_clear_env_file_cache()
@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 
 # Add the module to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 from gt.envoy import WrapperConfig, ApplicationWrapper
 
@@ -2,11 +2,15 @@
 
 import sys
 import os
+import logging
+import signal
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 # Add the module to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 from gt.envoy import (
     ApplicationWrapper,
@@ -14,8 +18,11 @@ from gt.envoy import (
     ExecutionResult,
     create_wrapper,
     WrapperError,
-    ExecutionError
+    ExecutionError,
+    clear_executable_cache
 )
+from gt.envoy import _executor
+from gt.envoy._executor import ProcessExecutor
 
 
 def test_basic_execution():
@@ -63,6 +70,43 @@ def test_environment_variables():
     print(f"  ✅ Environment test passed: {result.stdout.strip()}") # type: ignore
 
 
+def test_environment_changes_between_runs():
+    """Test that a reused wrapper sees os.environ as it is on each run."""
+    print("Testing environment changes between runs...")
+    
+    name = "ENVOY_TEST_BETWEEN_RUNS"
+    
+    def bump():
+        os.environ[name + "_HOOK"] = os.environ[name]
+    
+    config = WrapperConfig(
+        executable="python",
+        args=["-c", f"import os; print(os.environ.get('{name}'), os.environ.get('{name}_HOOK'))"],
+        env={"ENVOY_TEST_EXPLICIT": "1"},
+        inherit_env=True,
+        pre_run=bump,
+        capture_output=True,
+        stream_output=False,
+        log_execution=False
+    )
+    wrapper = ApplicationWrapper(config)
+    
+    try:
+        os.environ[name] = "first"
+        first = wrapper.run()
+        os.environ[name] = "second"
+        second = wrapper.run()
+    finally:
+        os.environ.pop(name, None)
+        os.environ.pop(name + "_HOOK", None)
+    
+    assert first.stdout == "first first", f"Unexpected first run output: {first.stdout}"
+    assert second.stdout == "second second", \
+        f"Second run should see the changed environment: {second.stdout}"
+    
+    print("  ✅ Environment changes between runs test passed")
+
+
 def test_pre_post_run():
     """Test pre and post run operations."""
     print("Testing pre/post run operations...")
@@ -119,6 +163,48 @@ def test_timeout():
     print(f"  ✅ Timeout test passed: timed_out={result.timed_out}, time={result.execution_time:.2f}s")
 
 
+def test_sigint_interrupts_run():
+    """Test that SIGINT stops the child and the host handler is restored."""
+    print("Testing SIGINT handling...")
+    
+    if os.name == 'nt' or threading.current_thread() is not threading.main_thread():
+        print("  ⏭️  Skipped (POSIX main thread only)")
+        return
+    
+    received = []
+    
+    def host_handler(signum, frame):
+        received.append(signum)
+    
+    config = WrapperConfig(
+        executable="python",
+        args=["-c", "import time; time.sleep(5)"],
+        raise_on_error=False,
+        stream_output=False,
+        log_execution=False
+    )
+    wrapper = ApplicationWrapper(config)
+    
+    original = signal.signal(signal.SIGINT, host_handler)
+    try:
+        timer = threading.Timer(0.3, os.kill, (os.getpid(), signal.SIGINT))
+        timer.start()
+        result = wrapper.run()
+        timer.join()
+        
+        restored = signal.getsignal(signal.SIGINT)
+        os.kill(os.getpid(), signal.SIGINT)
+    finally:
+        signal.signal(signal.SIGINT, original)
+    
+    assert result.return_code == -2, f"Interrupted run should return -2: {result.return_code}"
+    assert result.execution_time < 2.0, "Should stop well before the child finishes"
+    assert restored is host_handler, "The host's SIGINT handler should be restored"
+    assert received == [signal.SIGINT], "SIGINT after the run should reach the host handler"
+    
+    print("  ✅ SIGINT handling test passed")
+
+
 def test_error_handling():
     """Test error handling."""
     print("Testing error handling...")
@@ -189,6 +275,87 @@ def test_callbacks():
     print(f"  ✅ Callbacks test passed: {len(events['output'])} stdout, {len(events['error'])} stderr")
 
 
+def test_batch_callbacks():
+    """Test that batch callbacks see every line once, in order."""
+    print("Testing batch callbacks...")
+    
+    code = (
+        "import sys\n"
+        "for i in range(5000):\n"
+        "    print(f'out {i}')\n"
+        "    print(f'err {i}', file=sys.stderr)\n"
+        "sys.stdout.write('no newline')"
+    )
+    output_batches = []
+    error_batches = []
+    output_lines = []
+    
+    config = WrapperConfig(
+        executable="python",
+        args=["-c", code],
+        on_output=output_lines.append,
+        on_output_batch=output_batches.append,
+        on_error_batch=error_batches.append,
+        stream_output=False,
+        log_execution=False
+    )
+    result = ApplicationWrapper(config).run()
+    
+    expected_output = [f"out {i}" for i in range(5000)] + ["no newline"]
+    batched_output = [line for batch in output_batches for line in batch]
+    batched_errors = [line for batch in error_batches for line in batch]
+    
+    assert result.success, "Should execute successfully"
+    assert all(output_batches), "Batches should not be empty"
+    assert batched_output == expected_output, "Each stdout line should arrive once, in order"
+    assert batched_errors == [f"err {i}" for i in range(5000)], \
+        "Each stderr line should arrive once, in order"
+    assert output_lines == expected_output, "on_output should still see every line"
+    
+    print(f"  ✅ Batch callbacks test passed ({len(output_batches)} stdout batches)")
+
+
+def test_batch_callback_errors():
+    """Test that a failing batch callback is logged without stopping the pump."""
+    print("Testing batch callback errors...")
+    
+    records = []
+    
+    class _Collect(logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+    
+    def broken(lines):
+        raise RuntimeError("batch failed")
+    
+    output_lines = []
+    config = WrapperConfig(
+        executable="python",
+        args=["-c", "for i in range(1000): print(i)"],
+        on_output=output_lines.append,
+        on_output_batch=broken,
+        capture_output=True,
+        stream_output=False,
+        log_execution=False
+    )
+    
+    handler = _Collect()
+    executor_log = logging.getLogger("gt.envoy._executor")
+    executor_log.addHandler(handler)
+    try:
+        result = ApplicationWrapper(config).run()
+    finally:
+        executor_log.removeHandler(handler)
+    
+    assert result.success, "Should execute successfully"
+    assert output_lines == [str(i) for i in range(1000)], "Pump should keep delivering lines"
+    assert result.stdout == "\n".join(str(i) for i in range(1000)), "Capture should be complete"
+    assert records and all("on_output_batch callback error: batch failed" in r for r in records), \
+        f"Batch callback errors should be logged: {records[:1]}"
+    
+    print("  ✅ Batch callback errors test passed")
+
+
 def test_convenience_function():
     """Test create_wrapper convenience function."""
     print("Testing convenience function...")
@@ -236,17 +403,397 @@ def test_working_directory():
     print("  ✅ Working directory test passed")
 
 
+def test_relative_executable_follows_cwd():
+    """Test that a reused wrapper resolves a relative executable per run."""
+    print("Testing relative executable resolution...")
+    
+    if os.name == 'nt':
+        print("  ⏭️  Skipped (POSIX only)")
+        return
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tools = {}
+        for name in ("first", "second"):
+            tool = Path(tmpdir, name, "bin", "tool")
+            tool.parent.mkdir(parents=True)
+            tool.write_text(f"#!/bin/sh\necho {name}\n")
+            tool.chmod(0o755)
+            tools[name] = tool
+        
+        config = WrapperConfig(
+            executable="bin/tool",
+            capture_output=True,
+            stream_output=False,
+            log_execution=False
+        )
+        wrapper = ApplicationWrapper(config)
+        
+        try:
+            outputs = []
+            for name in ("first", "second"):
+                os.chdir(tools[name].parents[1])
+                outputs.append(wrapper.run().stdout)
+            
+            tools["second"].unlink()
+            try:
+                wrapper.run()
+                missing_error = None
+            except ExecutionError as e:
+                missing_error = str(e)
+        finally:
+            os.chdir(cwd)
+    
+    assert outputs == ["first", "second"], f"Should follow the working directory: {outputs}"
+    assert missing_error and "Executable not found" in missing_error, \
+        f"A removed executable should be reported: {missing_error}"
+    
+    print("  ✅ Relative executable resolution test passed")
+
+
+def test_max_captured_bytes():
+    """Test that max_captured_bytes keeps only the tail of each stream."""
+    print("Testing bounded output capture...")
+    
+    limit = 1000
+    code = (
+        "import sys\n"
+        "for i in range(2000):\n"
+        "    print(f'out é {i}')\n"
+        "    print(f'err é {i}', file=sys.stderr)"
+    )
+    
+    def run(max_captured_bytes):
+        config = WrapperConfig(
+            executable="python",
+            args=["-c", code],
+            capture_output=True,
+            stream_output=False,
+            max_captured_bytes=max_captured_bytes,
+            log_execution=False
+        )
+        return ApplicationWrapper(config).run()
+    
+    full = run(None)
+    bounded = run(limit)
+    
+    for name in ("stdout", "stderr"):
+        everything = getattr(full, name)
+        tail = getattr(bounded, name)
+        assert len(everything.encode()) > 10 * limit, f"Unbounded {name} should keep everything"
+        assert everything.endswith("1999"), f"Unbounded {name} should end with the last line"
+        assert len(tail.encode()) <= limit, f"Bounded {name} exceeds the limit"
+        assert everything.endswith(tail), f"Bounded {name} should be the tail of the output"
+        assert "�" not in tail, f"Bounded {name} should decode cleanly"
+        assert tail.split("\n")[0] in everything.split("\n"), \
+            f"Bounded {name} should start on a whole line"
+    
+    print("  ✅ Bounded output capture test passed")
+
+
+def test_context_manager():
+    """Test using the wrapper as a context manager."""
+    print("Testing context manager...")
+    
+    config = WrapperConfig(
+        executable="python",
+        args=["-c", "print('ctx')"],
+        capture_output=True,
+        stream_output=False,
+        log_execution=False
+    )
+    
+    with ApplicationWrapper(config) as wrapper:
+        assert isinstance(wrapper, ApplicationWrapper), "Should yield the wrapper itself"
+        result = wrapper.run()
+    
+    assert result.stdout == "ctx", "Should capture output"
+    
+    print("  ✅ Context manager test passed")
+
+
+def test_large_stderr_output():
+    """Test that a child filling stderr before writing stdout doesn't deadlock."""
+    print("Testing concurrent stdout/stderr draining...")
+    
+    config = WrapperConfig(
+        executable="python",
+        args=["-c", "import sys; sys.stderr.write('x' * 200000); print('done')"],
+        capture_output=True,
+        stream_output=False,
+        timeout=30.0,
+        log_execution=False
+    )
+    
+    wrapper = ApplicationWrapper(config)
+    result = wrapper.run()
+    
+    assert result.success, "Should execute successfully"
+    assert result.stdout == "done", "Should capture stdout"
+    assert len(result.stderr) == 200000, "Should capture all of stderr" # type: ignore
+    
+    print("  ✅ Concurrent draining test passed")
+
+
+def test_inheritable_fds_closed():
+    """Test that inheritable descriptors only reach the child with fast_spawn."""
+    print("Testing descriptor isolation...")
+    
+    if os.name == 'nt':
+        print("  ⏭️  Skipped (POSIX only)")
+        return
+    
+    read_fd, write_fd = os.pipe()
+    os.set_inheritable(write_fd, True)
+    code = (
+        "import os\n"
+        "try:\n"
+        f"    os.fstat({write_fd}); print('open')\n"
+        "except OSError:\n"
+        "    print('closed')"
+    )
+    try:
+        results = {}
+        for fast_spawn in (False, True):
+            config = WrapperConfig(
+                executable="python",
+                args=["-c", code],
+                capture_output=True,
+                stream_output=False,
+                fast_spawn=fast_spawn,
+                log_execution=False
+            )
+            results[fast_spawn] = ApplicationWrapper(config).run().stdout
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+    
+    assert results[False] == "closed", "Inheritable fds should be closed by default"
+    assert results[True] == "open", "fast_spawn should leave inheritable fds open"
+    
+    print("  ✅ Descriptor isolation test passed")
+
+
+def test_executable_cache():
+    """Test that clear_executable_cache picks up newly installed executables."""
+    print("Testing executable cache invalidation...")
+    
+    if os.name == 'nt':
+        print("  ⏭️  Skipped (POSIX only)")
+        return
+    
+    def install(directory: Path) -> str:
+        tool = directory / "envoy_cache_tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        return str(tool)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        first, second = Path(tmpdir, "first"), Path(tmpdir, "second")
+        first.mkdir()
+        second.mkdir()
+        search_path = os.pathsep.join([str(first), str(second)])
+        resolve = ProcessExecutor.resolve_executable
+        
+        executor = ProcessExecutor()
+        
+        later = install(second)
+        assert resolve("envoy_cache_tool", search_path) == later
+        assert executor.prepare_command("envoy_cache_tool", [], search_path)[0] == later
+        
+        earlier = install(first)
+        assert resolve("envoy_cache_tool", search_path) == later, \
+            "Lookup should be served from the cache"
+        
+        clear_executable_cache()
+        assert resolve("envoy_cache_tool", search_path) == earlier, \
+            "Cleared cache should find the executable earlier on PATH"
+        assert executor.prepare_command("envoy_cache_tool", [], search_path)[0] == earlier, \
+            "Clearing the cache should also drop the executor's memo"
+        
+        # A failed lookup must not invalidate what other lookups have cached
+        generation = _executor._resolution_generation
+        try:
+            resolve("envoy_missing_tool", search_path)
+        except WrapperError:
+            pass
+        assert _executor._resolution_generation == generation, \
+            "A failed lookup should leave cached resolutions in place"
+        
+        Path(earlier).unlink()
+        assert resolve("envoy_cache_tool", search_path) == later, \
+            "A removed executable should be looked up again"
+    
+    print("  ✅ Executable cache invalidation test passed")
+
+
+def _process_alive(pid: int) -> bool:
+    """Return True if pid is a live (not zombie) process."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+    except OSError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_new_process_group():
+    """Test that a timed-out run with new_process_group stops grandchildren."""
+    print("Testing process group termination...")
+    
+    if os.name == 'nt':
+        print("  ⏭️  Skipped (POSIX only)")
+        return
+    
+    config = WrapperConfig(
+        executable="sh",
+        args=["-c", "sleep 30 & echo $!; wait"],
+        timeout=0.5,
+        new_process_group=True,
+        capture_output=True,
+        stream_output=False,
+        raise_on_error=False,
+        log_execution=False
+    )
+    result = ApplicationWrapper(config).run()
+    grandchild = int(result.stdout.split()[0])  # type: ignore
+    
+    deadline = time.monotonic() + 2.0
+    while _process_alive(grandchild) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    alive = _process_alive(grandchild)
+    if alive:
+        os.kill(grandchild, signal.SIGKILL)
+    
+    assert result.timed_out, "Should time out"
+    assert result.execution_time < 5.0, "Should not wait for the grandchild"
+    assert not alive, "The grandchild should be terminated with the group"
+    
+    print("  ✅ Process group termination test passed")
+
+
+def test_wait_process_interrupted():
+    """Test that wait_process stops promptly once interrupted flips."""
+    print("Testing interruptible waits...")
+    
+    import subprocess
+    
+    def wait(use_pidfd: bool) -> tuple[int, float]:
+        flip_at = time.monotonic() + 0.3
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+        saved = _executor._pidfd_open
+        if not use_pidfd:
+            # Force the Popen.wait polling fallback
+            _executor._pidfd_open = None
+        try:
+            start = time.monotonic()
+            code = ProcessExecutor().wait_process(
+                process, interrupted=lambda: time.monotonic() >= flip_at
+            )
+            return code, time.monotonic() - start
+        finally:
+            _executor._pidfd_open = saved
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+    
+    modes = [False]
+    if _executor._pidfd_open is not None:
+        modes.insert(0, True)
+    for use_pidfd in modes:
+        code, elapsed = wait(use_pidfd)
+        mode = "pidfd" if use_pidfd else "polling"
+        assert code != 0, f"{mode}: interrupted process should not exit cleanly"
+        assert elapsed < 2.0, f"{mode}: wait should return promptly, took {elapsed:.2f}s"
+    
+    # Without an interrupt the pidfd wait returns as soon as the child exits
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    assert ProcessExecutor().wait_process(process, interrupted=lambda: False) == 0
+    
+    print(f"  ✅ Interruptible waits test passed ({', '.join('pidfd' if m else 'polling' for m in modes)})")
+
+
+def test_run_async():
+    """Test awaiting several wrappers concurrently."""
+    print("Testing run_async...")
+    
+    import asyncio
+    
+    async def run_both():
+        wrappers = [
+            create_wrapper(
+                "python", "-c", f"print('async{i}')",
+                capture_output=True,
+                stream_output=False,
+                log_execution=False
+            )
+            for i in range(2)
+        ]
+        return await asyncio.gather(*(w.run_async() for w in wrappers))
+    
+    results = asyncio.run(run_both())
+    
+    assert all(r.success for r in results), "All runs should succeed"
+    assert [r.stdout for r in results] == ["async0", "async1"], "Should capture each output"
+    
+    print("  ✅ run_async test passed")
+
+
+def test_run_many():
+    """Test running several configurations on a thread pool."""
+    print("Testing run_many...")
+    
+    configs = [
+        WrapperConfig(
+            executable="python",
+            args=["-c", f"print('many{i}')"],
+            capture_output=True,
+            stream_output=False,
+            log_execution=False
+        )
+        for i in range(3)
+    ]
+    
+    results = ApplicationWrapper.run_many(configs, max_concurrency=2)
+    
+    assert all(r.success for r in results), "All runs should succeed"
+    assert [r.stdout for r in results] == ["many0", "many1", "many2"], \
+        "Results should follow config order"
+    
+    print("  ✅ run_many test passed")
+
+
 def run_all_tests():
     """Run all tests."""
     tests = [
         test_basic_execution,
         test_environment_variables,
+        test_environment_changes_between_runs,
         test_pre_post_run,
         test_timeout,
+        test_sigint_interrupts_run,
         test_error_handling,
         test_callbacks,
+        test_batch_callbacks,
+        test_batch_callback_errors,
         test_convenience_function,
-        test_working_directory
+        test_working_directory,
+        test_relative_executable_follows_cwd,
+        test_context_manager,
+        test_large_stderr_output,
+        test_max_captured_bytes,
+        test_inheritable_fds_closed,
+        test_executable_cache,
+        test_new_process_group,
+        test_wait_process_interrupted,
+        test_run_async,
+        test_run_many
     ]
     
     print("=" * 60)
@@ -5,7 +5,7 @@ import json
 from pathlib import Path
 
 # Add the module to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 from gt.envoy import WrapperConfig, ApplicationWrapper
 
@@ -35,8 +35,7 @@ os.environ['TEST_PREPEND'] = 'D:/original_prepend'
 config = WrapperConfig(
     executable='python',
     args=['-c', '''
-import os, sys
-sep = ";" if sys.platform == "win32" else ":"
+import os
 print("TEST_LIST:", os.environ.get("TEST_LIST"))
 print("TEST_STRING:", os.environ.get("TEST_STRING"))
 print("TEST_APPEND:", os.environ.get("TEST_APPEND"))